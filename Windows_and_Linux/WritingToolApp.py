@@ -120,6 +120,15 @@ class WritingToolApp(QtWidgets.QApplication):
         self.settings_manager = SettingsManager(mode=mode)
         self.load_settings()
 
+        # Deferred save for settings that change often (e.g. the response window zoom):
+        # changes made while one is pending share a single write
+        self._settings_flush_timer = QtCore.QTimer()
+        self._settings_flush_timer.setSingleShot(True)
+        self._settings_flush_timer.setTimerType(QtCore.Qt.TimerType.CoarseTimer)
+        self._settings_flush_timer.setInterval(500)
+        self._settings_flush_timer.timeout.connect(self.save_settings)
+        self.aboutToQuit.connect(self.flush_settings_save)
+
     def _setup_ui_components(self):
         """Initialize UI component references."""
         self.onboarding_window = None
@@ -148,6 +157,8 @@ class WritingToolApp(QtWidgets.QApplication):
             AnthropicProvider(self),
             MistralProvider(self),
         ]
+        # Providers by internal name, for lookups from the saved settings and the settings window
+        self.providers_by_name = {provider.internal_name: provider for provider in self.providers}
 
     def _setup_spam_protection(self):
         """Initialize hotkey spam protection system."""
@@ -185,10 +196,7 @@ class WritingToolApp(QtWidgets.QApplication):
         provider_internal_name = self.settings_manager.provider or "gemini"
         self._logger.debug(f"Selected provider: {provider_internal_name}")
 
-        self.current_provider = next(
-            (provider for provider in self.providers if provider.internal_name == provider_internal_name),
-            None,
-        )
+        self.current_provider = self.providers_by_name.get(provider_internal_name)
 
         if not self.current_provider:
             self._logger.warning(f"Provider {provider_internal_name} not found. Using default provider.")
@@ -335,6 +343,17 @@ class WritingToolApp(QtWidgets.QApplication):
         """Save the current unified settings."""
         return self.settings_manager.save_settings()
 
+    def schedule_settings_save(self):
+        """Save the current unified settings shortly, once for a burst of changes."""
+        if not self._settings_flush_timer.isActive():
+            self._settings_flush_timer.start()
+
+    def flush_settings_save(self):
+        """Write a scheduled settings save right away."""
+        if self._settings_flush_timer.isActive():
+            self._settings_flush_timer.stop()
+            self.save_settings()
+
     # ============================================================================
     # HOTKEY AND INPUT HANDLING METHODS
     # ============================================================================
@@ -430,10 +449,8 @@ class WritingToolApp(QtWidgets.QApplication):
             provider_name = "gemini"
             self.settings_manager.provider = provider_name
 
-        self.current_provider = next(
-            (provider for provider in self.providers if provider.internal_name == provider_name),
-            self.providers[0],  # Default to first provider
-        )
+        # Default to first provider
+        self.current_provider = self.providers_by_name.get(provider_name, self.providers[0])
 
         # Load provider-specific config from system settings
         if self.current_provider:
@@ -1325,7 +1342,18 @@ class WritingToolApp(QtWidgets.QApplication):
         self.last_tray_click_time = current_time
 
         logging.debug("Showing settings window")
-        # Always create a new settings window to handle providers_only correctly
+        # Bring an open settings window to the front instead of replacing it, which would drop its edits
+        window = self.settings_window
+        if window is not None and window.isVisible() and window.providers_only == providers_only:
+            if previous_window:
+                window.previous_window = previous_window
+            if window.isMinimized():
+                window.showNormal()
+            window.raise_()
+            window.activateWindow()
+            return
+
+        # Otherwise create a new settings window to handle providers_only correctly
         self.settings_window = ui.SettingsWindow.SettingsWindow(self, providers_only=providers_only)
 
         # Set reference to previous window for navigation
@@ -88,7 +88,6 @@ from config.constants import (
     OPENAI_MODELS,
 )
 from config.data_operations import get_default_model_for_provider
-from ui.ui_utils import colorMode
 
 # Type checking imports
 if TYPE_CHECKING:
@@ -155,23 +154,13 @@ class TextSetting(AIProviderSetting):
 
     def render_to_layout(self, layout: QVBoxLayout):
         """Create and add the QLineEdit with its label to the layout."""
-        from ui.ui_utils import get_effective_color_mode
-
+        # Styled by the settings window stylesheet through the object names
         row_layout = QtWidgets.QHBoxLayout()
         label = QtWidgets.QLabel(self.display_name)
-        current_mode = get_effective_color_mode()
-        label.setStyleSheet(f"font-size: 16px; color: {'#ffffff' if current_mode=='dark' else '#333333'};")
+        label.setObjectName("setting_label")
         row_layout.addWidget(label)
         self.input = QtWidgets.QLineEdit(self.internal_value)
-        self.input.setStyleSheet(
-            f"""
-            font-size: 16px;
-            padding: 5px;
-            background-color: {'#444' if current_mode=='dark' else 'white'};
-            color: {'#ffffff' if current_mode=='dark' else '#000000'};
-            border: 1px solid {'#666' if current_mode=='dark' else '#ccc'};
-        """,
-        )
+        self.input.setObjectName("setting_input")
         self.input.setPlaceholderText(self.description)
         # Connect auto-save if callback is set
         if self.auto_save_callback:
@@ -217,27 +206,16 @@ class DropdownSetting(AIProviderSetting):
 
     def render_to_layout(self, layout: QVBoxLayout):
         """Create and configure the QComboBox with available options."""
-        from ui.ui_utils import get_effective_color_mode
-
+        # Styled by the settings window stylesheet through the object names
         row_layout = QtWidgets.QHBoxLayout()
         label = QtWidgets.QLabel(self.display_name)
-        current_mode = get_effective_color_mode()
-        label.setStyleSheet(f"font-size: 16px; color: {'#ffffff' if current_mode=='dark' else '#333333'};")
+        label.setObjectName("setting_label")
         row_layout.addWidget(label)
         self.dropdown = QtWidgets.QComboBox()
+        self.dropdown.setObjectName("setting_dropdown")
         self.dropdown.setEditable(self.editable)  # Allow custom input if editable
         # Ensure dropdown can receive focus and clicks properly
         self.dropdown.setFocusPolicy(QtCore.Qt.FocusPolicy.StrongFocus)
-        self.dropdown.setStyleSheet(
-            f"""
-            font-size: 16px;
-            padding: 5px;
-            padding-right: 25px;
-            background-color: {'#444' if current_mode=='dark' else 'white'};
-            color: {'#ffffff' if current_mode=='dark' else '#000000'};
-            border: 1px solid {'#666' if current_mode=='dark' else '#ccc'};
-        """,
-        )
         for option, value in self.options:
             self.dropdown.addItem(option, value)
 
@@ -957,7 +935,7 @@ def install_ollama_auto(app):
 def install_ollama_windows(app):
     """
     Download and install Ollama on Windows automatically.
-    Shows a progress window with animated loading dots during the process.
+    Shows a progress window with an animated progress bar during the process.
     """
     from ui.ProgressWindow import OllamaInstallProgressWindow
     from PySide6.QtWidgets import QApplication
@@ -0,0 +1,58 @@
+"""Shared fixtures for the UI tests, run offscreen without a display."""
+
+import os
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+QtWidgets = pytest.importorskip("PySide6.QtWidgets")
+QtCore = pytest.importorskip("PySide6.QtCore")
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    """The QApplication shared by all tests."""
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+
+@pytest.fixture
+def wait(qapp):
+    """Run the event loop for the given number of milliseconds."""
+
+    def _wait(ms):
+        loop = QtCore.QEventLoop()
+        QtCore.QTimer.singleShot(ms, loop.quit)
+        loop.exec()
+
+    return _wait
+
+
+class _Signal:
+    def connect(self, slot):
+        pass
+
+
+class FakeApp:
+    """The parts of WritingToolApp a ResponseWindow uses."""
+
+    followup_response_signal = _Signal()
+
+    def __init__(self, custom_data=None):
+        self.settings_manager = SimpleNamespace(settings=SimpleNamespace(custom_data=custom_data or {}))
+        self.scheduled_saves = 0
+        self.followup_questions = []
+
+    def schedule_settings_save(self):
+        self.scheduled_saves += 1
+
+    def process_followup_question(self, response_window, question):
+        self.followup_questions.append(question)
+
+
+@pytest.fixture
+def fake_app():
+    return FakeApp()
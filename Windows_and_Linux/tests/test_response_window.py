@@ -0,0 +1,54 @@
+"""Zoom handling of the response window."""
+
+import pytest
+
+ResponseWindow = pytest.importorskip("ui.ResponseWindow").ResponseWindow
+
+
+def _open_window(app, wait, text="Some **answer**"):
+    window = ResponseWindow(app, "Proofread")
+    window.selected_text = "hello"
+    window.show()
+    window.set_text(text)
+    wait(50)
+    return window
+
+
+def _zoom_factors(window):
+    layout = window.chat_area.layout
+    return [layout.itemAt(i).widget().text_display.zoom_factor for i in range(layout.count() - 1)]
+
+
+def test_zoom_is_saved_on_close(fake_app, wait):
+    window = _open_window(fake_app, wait)
+    for _step in range(5):
+        window.zoom_all_messages("in")
+    window.close()
+
+    zoom = fake_app.settings_manager.settings.custom_data["response_window_zoom"]
+    assert zoom == pytest.approx(1.2 * 1.1**5)
+    assert fake_app.scheduled_saves == 1
+
+
+def test_saved_zoom_is_restored(fake_app, wait):
+    fake_app.settings_manager.settings.custom_data["response_window_zoom"] = 1.5
+    window = _open_window(fake_app, wait)
+
+    assert _zoom_factors(window) == [1.5]
+    window.close()
+
+
+def test_new_messages_start_at_the_current_zoom(fake_app, wait):
+    window = _open_window(fake_app, wait)
+    for _step in range(5):
+        window.zoom_all_messages("in")
+    wait(300)
+
+    window.input_field.setText("a question")
+    window.send_message()
+    window.handle_followup_response("A *reply*")
+    wait(50)
+
+    assert fake_app.followup_questions == ["a question"]
+    assert _zoom_factors(window) == [pytest.approx(1.2 * 1.1**5)] * 3
+    window.close()
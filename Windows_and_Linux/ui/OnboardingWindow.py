@@ -1,6 +1,7 @@
 import logging
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
+import darkdetect
 from PySide6 import QtCore, QtGui, QtWidgets
 from PySide6.QtWidgets import QHBoxLayout, QRadioButton
 
@@ -10,8 +11,134 @@ from ui.ThemeManager import ThemeAwareMixin
 if TYPE_CHECKING:
     from Windows_and_Linux.WritingToolApp import WritingToolApp
 
+logger = logging.getLogger(__name__)
+
 _ = lambda x: x
 
+# Qt enum values resolved once instead of on every widget build
+_ALIGN_CENTER = QtCore.Qt.AlignmentFlag.AlignCenter
+_ALIGN_LEFT = QtCore.Qt.AlignmentFlag.AlignLeft
+_NO_FRAME = QtWidgets.QFrame.Shape.NoFrame
+_SB_AS_NEEDED = QtCore.Qt.ScrollBarPolicy.ScrollBarAsNeeded
+
+# Window stylesheet, with @variables substituted from the color mode palette.
+# Widgets are matched by object name, by their "role" property or by type.
+_WINDOW_QSS_TEMPLATE = """
+    QLabel#title_label {
+        font-size: 24px;
+        font-weight: bold;
+        color: @text;
+    }
+    QLabel[role="content"] {
+        font-size: 16px;
+        color: @text;
+    }
+    QLineEdit {
+        font-size: 16px;
+        padding: 5px;
+        background-color: @field_bg;
+        color: @field_fg;
+        border: 1px solid @border;
+    }
+    QRadioButton {
+        color: @text;
+    }
+    QComboBox {
+        background-color: @field_bg;
+        color: @field_fg;
+        border: 1px solid @border;
+        padding: 5px;
+        font-size: 14px;
+    }
+    QComboBox QAbstractItemView {
+        background-color: @field_bg;
+        color: @field_fg;
+        selection-background-color: @selection;
+    }
+    QPushButton#next_button {
+        background-color: #4CAF50;
+        color: white;
+        padding: 10px;
+        font-size: 16px;
+        border: none;
+        border-radius: 5px;
+    }
+    QPushButton#next_button:hover {
+        background-color: #45a049;
+    }
+"""
+
+_PALETTES = {
+    'dark': {
+        '@text': '#ffffff',
+        '@field_bg': '#444',
+        '@field_fg': '#ffffff',
+        '@border': '#666',
+        '@selection': '#666',
+    },
+    'light': {
+        '@text': '#333333',
+        '@field_bg': 'white',
+        '@field_fg': '#000000',
+        '@border': '#ccc',
+        '@selection': '#e0e0e0',
+    },
+}
+
+# Scroll area styling (same look as SettingsWindow)
+_SCROLL_AREA_QSS = """
+    QScrollArea {
+        background: transparent;
+        border: none;
+    }
+    QScrollArea > QWidget > QWidget {
+        background: transparent;
+    }
+"""
+
+# Custom styling for transparent and aesthetic scroll bars
+_SCROLL_BAR_QSS = """
+    QScrollBar:vertical {
+        background-color: rgba(0, 0, 0, 0.1);
+        width: 12px;
+        margin: 0px;
+        border-radius: 6px;
+    }
+    QScrollBar::handle:vertical {
+        background-color: rgba(128, 128, 128, 0.6);
+        min-height: 20px;
+        border-radius: 6px;
+        margin: 2px;
+    }
+    QScrollBar::handle:vertical:hover {
+        background-color: rgba(128, 128, 128, 0.8);
+    }
+    QScrollBar::handle:vertical:pressed {
+        background-color: rgba(128, 128, 128, 1.0);
+    }
+    QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
+        height: 0px;
+    }
+    QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {
+        background: transparent;
+    }
+"""
+
+# Installed once the content overflows and the scroll bar becomes visible
+_SCROLL_AREA_WITH_BAR_QSS = _SCROLL_AREA_QSS + _SCROLL_BAR_QSS
+
+
+class _NoWheelComboBox(QtWidgets.QComboBox):
+    """Combo box that lets wheel events scroll the page instead of changing the selection."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # No WheelFocus: scrolling over the combo must not grab focus on the way to the page
+        self.setFocusPolicy(QtCore.Qt.FocusPolicy.StrongFocus)
+
+    def wheelEvent(self, event):
+        event.ignore()
+
 
 class OnboardingWindow(ThemeAwareMixin, ThemedWidget):
     """
@@ -19,9 +146,13 @@ class OnboardingWindow(ThemeAwareMixin, ThemedWidget):
     Guides users through initial configuration including shortcuts and theme selection.
     """
 
-    # Signal emitted when window is closed (not when proceeding to next step)
+    # Signal emitted when window is closed (disconnected before proceeding to next step)
     close_signal = QtCore.Signal()
 
+    # Window stylesheet per effective color mode ("dark"/"light"), built lazily.
+    # It only depends on the mode, so every onboarding window shares it.
+    _stylesheet_cache: dict[str, str] = {}
+
     def __init__(self, app: 'WritingToolApp'):
         super().__init__()
         self.app = app
@@ -30,24 +161,46 @@ class OnboardingWindow(ThemeAwareMixin, ThemedWidget):
         self.shortcut = "ctrl+space"
         self.theme = "gradient"
 
+        # Effective color mode, resolved lazily (darkdetect is only queried once per theme change)
+        self._effective_mode_cache: Optional[str] = None
+
+        # Features text is translated and formatted once per window
+        self._features_content = self._get_features_content()
+
         # UI components that will be referenced later
         self.content_layout: QtWidgets.QVBoxLayout
+        self.scroll_area: QtWidgets.QScrollArea
         self.shortcut_input: QtWidgets.QLineEdit  # Text field for shortcut input
         self.gradient_radio: QRadioButton  # Radio button for gradient theme
         self.plain_radio: QRadioButton  # Radio button for plain theme
 
-        # Control flags
-        self.self_close = False  # Flag to distinguish self-closing from user closing
-
         # Window dimensions
         self.min_width = 600
         self.min_height = 550
 
+        # Applies the shortcut once typing pauses instead of on every keystroke
+        self._shortcut_save_timer = QtCore.QTimer(self)
+        self._shortcut_save_timer.setSingleShot(True)
+        self._shortcut_save_timer.setInterval(400)
+        self._shortcut_save_timer.timeout.connect(self._save_shortcut_setting)
+
+        # Coalesces rapid color mode changes into a single theme application
+        self._mode_apply_timer = QtCore.QTimer(self)
+        self._mode_apply_timer.setSingleShot(True)
+        self._mode_apply_timer.setInterval(50)
+        self._mode_apply_timer.timeout.connect(self._apply_color_mode_change)
+
+        # Coalesces settings writes from rapid edits into a single disk flush
+        self._settings_flush_timer = QtCore.QTimer(self)
+        self._settings_flush_timer.setSingleShot(True)
+        self._settings_flush_timer.setInterval(500)
+        self._settings_flush_timer.timeout.connect(self._flush_settings)
+
         self.init_ui()
 
     def init_ui(self):
         """Initialize the user interface for the onboarding window."""
-        logging.debug("Initializing onboarding UI")
+        logger.debug("Initializing onboarding UI")
         self._setup_window()
         self._create_layout()
         self._show_welcome_screen()
@@ -62,122 +215,119 @@ class OnboardingWindow(ThemeAwareMixin, ThemedWidget):
 
     def _create_layout(self):
         """Create the main layout structure with scroll area and margins."""
-        # Main layout is already created in ThemedWidget with proper margins
-        main_layout = QtWidgets.QVBoxLayout(self.background)
+        # Layouts are built detached and installed last so Qt activates them once
+        main_layout = QtWidgets.QVBoxLayout()
 
         # Create scroll area with same styling as SettingsWindow
         scroll_area = QtWidgets.QScrollArea()
         scroll_area.setWidgetResizable(True)
-        scroll_area.setFrameShape(QtWidgets.QFrame.Shape.NoFrame)
-        scroll_area.setHorizontalScrollBarPolicy(
-            QtCore.Qt.ScrollBarPolicy.ScrollBarAsNeeded,
-        )
+        scroll_area.setFrameShape(_NO_FRAME)
+        scroll_area.setHorizontalScrollBarPolicy(_SB_AS_NEEDED)
 
-        # Custom styling for transparent and aesthetic scroll bars
-        scroll_area.setStyleSheet(
-            """
-            QScrollArea {
-                background: transparent;
-                border: none;
-            }
-            QScrollArea > QWidget > QWidget {
-                background: transparent;
-            }
-            QScrollBar:vertical {
-                background-color: rgba(0, 0, 0, 0.1);
-                width: 12px;
-                margin: 0px;
-                border-radius: 6px;
-            }
-            QScrollBar::handle:vertical {
-                background-color: rgba(128, 128, 128, 0.6);
-                min-height: 20px;
-                border-radius: 6px;
-                margin: 2px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background-color: rgba(128, 128, 128, 0.8);
-            }
-            QScrollBar::handle:vertical:pressed {
-                background-color: rgba(128, 128, 128, 1.0);
-            }
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                height: 0px;
-            }
-            QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {
-                background: transparent;
-            }
-            """
-        )
+        # Transparent scroll area; the scroll bar styling is only installed
+        # once the content actually overflows (see _on_scroll_range_changed)
+        scroll_area.setStyleSheet(_SCROLL_AREA_QSS)
+        scroll_area.verticalScrollBar().rangeChanged.connect(self._on_scroll_range_changed)
+        self.scroll_area = scroll_area
 
-        # Create scrollable content widget with transparent background
+        # Create scrollable content widget (kept transparent by _SCROLL_AREA_QSS)
         scroll_content = QtWidgets.QWidget()
-        scroll_content.setStyleSheet("background: transparent;")
-        self.content_layout = QtWidgets.QVBoxLayout(scroll_content)
+        self.content_layout = QtWidgets.QVBoxLayout()
         self.content_layout.setContentsMargins(30, 30, 30, 30)
         self.content_layout.setSpacing(20)
+        scroll_content.setLayout(self.content_layout)
 
         # Set up scroll area
         scroll_area.setWidget(scroll_content)
         main_layout.addWidget(scroll_area)
+        self.background.setLayout(main_layout)
+
+        # Single window-level stylesheet; widgets are matched by object name or role
+        self.background.setStyleSheet(self._get_stylesheet())
+
+    def _on_scroll_range_changed(self, minimum, maximum):
+        """Install the scroll bar styling the first time the content overflows."""
+        if maximum <= minimum:
+            return
+        self.scroll_area.verticalScrollBar().rangeChanged.disconnect(self._on_scroll_range_changed)
+        self.scroll_area.setStyleSheet(_SCROLL_AREA_WITH_BAR_QSS)
 
     def _show_welcome_screen(self):
         """Display the main welcome screen with features and settings configuration."""
         ui_utils.clear_layout(self.content_layout)
 
-        # Main title at the top
-        title_label = self._create_title_label()
-        self.content_layout.addWidget(title_label, alignment=QtCore.Qt.AlignmentFlag.AlignCenter)
-
-        # Features description section
-        features_widget = self._create_features_section()
-        self.content_layout.addWidget(features_widget)
-
-        # Keyboard shortcut configuration section (auto-saves on change)
-        shortcut_section = self._create_shortcut_section()
-        self.content_layout.addLayout(shortcut_section)
-
-        # Color mode selection section (auto-saves on change)
-        color_mode_section = self._create_color_mode_section()
-        self.content_layout.addLayout(color_mode_section)
+        # Show the title and features first; the heavier configuration widgets
+        # are appended once the window had a chance to paint
+        self._add_section_container(
+            (self._create_title_label, _ALIGN_CENTER),
+            (self._create_features_section, None),
+        )
+        QtCore.QTimer.singleShot(0, self._add_config_sections)
+
+    def _add_config_sections(self):
+        """Append the configuration sections and the navigation button below the introduction."""
+        self._add_section_container(
+            # Keyboard shortcut configuration section (auto-saves on change)
+            (self._create_shortcut_section, None),
+            # Color mode selection section (auto-saves on change)
+            (self._create_color_mode_section, None),
+            # Theme selection section (auto-saves and applies on change)
+            (self._create_theme_section, None),
+            # Navigation button to proceed to next step (API configuration)
+            (self._create_next_button, None),
+        )
 
-        # Theme selection section (auto-saves and applies on change)
-        theme_section = self._create_theme_section()
-        self.content_layout.addLayout(theme_section)
+    def _add_section_container(self, *sections):
+        """
+        Build the given sections into a detached container, then add it to the content layout.
 
-        # Navigation button to proceed to next step (API configuration)
-        next_button = self._create_next_button()
-        self.content_layout.addWidget(next_button)
+        Args:
+            sections: (factory, alignment) pairs; factories return a widget or a layout
+        """
+        content_layout = self.content_layout
+        self.setUpdatesEnabled(False)
+        try:
+            # Populating the container off-tree means the visible content layout
+            # only gets a single insertion (one layout pass)
+            container = QtWidgets.QWidget()
+            container_layout = QtWidgets.QVBoxLayout()
+            container_layout.setContentsMargins(0, 0, 0, 0)
+            container_layout.setSpacing(content_layout.spacing())
+
+            for create_section, alignment in sections:
+                section = create_section()
+                if isinstance(section, QtWidgets.QLayout):
+                    container_layout.addLayout(section)
+                elif alignment is not None:
+                    container_layout.addWidget(section, alignment=alignment)
+                else:
+                    container_layout.addWidget(section)
+
+            container.setLayout(container_layout)
+            content_layout.addWidget(container)
+        finally:
+            self.setUpdatesEnabled(True)
 
     def _create_title_label(self):
         """Create the main title label with theme-appropriate styling."""
         title_label = QtWidgets.QLabel(_("Welcome to Writing Tools") + "!")
-        title_label.setObjectName("title_label")  # Set object name for style refresh
-        title_label.setStyleSheet(self._get_title_style())
+        title_label.setObjectName("title_label")  # Matched by the window stylesheet
         return title_label
 
     def _get_effective_mode(self):
-        """Get the effective color mode based on user settings."""
-        user_mode = self.app.settings_manager.color_mode or "auto"
-        if user_mode == "auto":
-            import darkdetect
-
-            return "dark" if darkdetect.isDark() else "light"
-        return user_mode
-
-    def _get_title_style(self):
-        """Get the title styling based on current theme (dark/light mode)."""
-        current_mode = self._get_effective_mode()
-        color = '#ffffff' if current_mode == 'dark' else '#333333'
-        return f"font-size: 24px; font-weight: bold; color: {color};"
+        """Get the effective color mode based on user settings (cached until the theme changes)."""
+        if self._effective_mode_cache is None:
+            user_mode = self.app.settings_manager.color_mode or "auto"
+            if user_mode == "auto":
+                user_mode = "dark" if darkdetect.isDark() else "light"
+            self._effective_mode_cache = user_mode
+        return self._effective_mode_cache
 
     def _create_features_section(self):
         """Create the features description section showing app capabilities."""
-        features_content = self._get_features_content()
-
-        features_label = QtWidgets.QLabel(features_content)
-        features_label.setStyleSheet(self._get_content_style())
-        features_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignLeft)
+        features_label = QtWidgets.QLabel(self._features_content)
+        features_label.setProperty("role", "content")
+        features_label.setAlignment(_ALIGN_LEFT)
         return features_label
 
     def _get_features_content(self):
@@ -200,12 +350,11 @@ class OnboardingWindow(ThemeAwareMixin, ThemedWidget):
 
         # Label explaining the shortcut configuration
         shortcut_label = QtWidgets.QLabel(_('Customize your shortcut key (default: "ctrl+space"):'))
-        shortcut_label.setStyleSheet(self._get_content_style())
+        shortcut_label.setProperty("role", "content")
         shortcut_layout.addWidget(shortcut_label)
 
         # Text input field for shortcut (auto-saves on change)
         self.shortcut_input = QtWidgets.QLineEdit(self.shortcut)
-        self.shortcut_input.setStyleSheet(self._get_input_style())
         # Connect signal to auto-save when user types
         self.shortcut_input.textChanged.connect(self._on_shortcut_changed)
         shortcut_layout.addWidget(self.shortcut_input)
@@ -218,26 +367,24 @@ class OnboardingWindow(ThemeAwareMixin, ThemedWidget):
 
         # Color mode selection title
         color_mode_title = QtWidgets.QLabel(_("Color Mode:"))
-        color_mode_title.setStyleSheet(self._get_content_style())
+        color_mode_title.setProperty("role", "content")
         color_mode_layout.addWidget(color_mode_title)
 
         # Dropdown for color mode selection
-        self.color_mode_dropdown = QtWidgets.QComboBox()
-        self.color_mode_dropdown.addItems([_("Auto"), _("Light"), _("Dark")])
+        # (wheel scrolling is ignored so it does not interfere with the main scroll area)
+        self.color_mode_dropdown = _NoWheelComboBox()
+        # Each item carries its internal color mode key as user data
+        self.color_mode_dropdown.addItem(_("Auto"), "auto")
+        self.color_mode_dropdown.addItem(_("Light"), "light")
+        self.color_mode_dropdown.addItem(_("Dark"), "dark")
 
         # Set current selection based on saved setting (preserve existing values)
         current_mode = self.app.settings_manager.color_mode or "auto"
-        mode_index = {"auto": 0, "light": 1, "dark": 2}.get(current_mode, 0)
-        self.color_mode_dropdown.setCurrentIndex(mode_index)
-
-        # Apply styling to dropdown
-        self.color_mode_dropdown.setStyleSheet(self._get_dropdown_style())
+        mode_index = self.color_mode_dropdown.findData(current_mode)
+        self.color_mode_dropdown.setCurrentIndex(max(mode_index, 0))
 
         # Auto-save color mode changes for immediate visual feedback
-        self.color_mode_dropdown.currentTextChanged.connect(self.auto_save_color_mode)
-
-        # Prevent wheel scroll from interfering with main scroll area
-        self.color_mode_dropdown.wheelEvent = lambda e: e.ignore()
+        self.color_mode_dropdown.currentIndexChanged.connect(self.auto_save_color_mode)
 
         color_mode_layout.addWidget(self.color_mode_dropdown)
 
@@ -249,7 +396,7 @@ class OnboardingWindow(ThemeAwareMixin, ThemedWidget):
 
         # Label for theme selection
         theme_label = QtWidgets.QLabel(_("Choose your theme:"))
-        theme_label.setStyleSheet(self._get_content_style())
+        theme_label.setProperty("role", "content")
         theme_layout.addWidget(theme_label)
 
         # Container for radio buttons (horizontal layout)
@@ -259,18 +406,17 @@ class OnboardingWindow(ThemeAwareMixin, ThemedWidget):
         self.gradient_radio = QRadioButton(_("Gradient"))  # Gradient background theme
         self.plain_radio = QRadioButton(_("Plain"))  # Plain background theme
 
-        # Apply styling to radio buttons
-        radio_style = self._get_radio_style()
-        self.gradient_radio.setStyleSheet(radio_style)
-        self.plain_radio.setStyleSheet(radio_style)
-
         # Set default selection based on current theme
         self.gradient_radio.setChecked(self.theme == "gradient")
         self.plain_radio.setChecked(self.theme == "plain")
 
-        # Connect signals for immediate theme change and auto-save
-        self.gradient_radio.toggled.connect(self._on_theme_changed)
-        self.plain_radio.toggled.connect(self._on_theme_changed)
+        # Group the radios so a single signal fires per user selection
+        self._theme_group = QtWidgets.QButtonGroup(self)
+        self._theme_group.addButton(self.gradient_radio)
+        self._theme_group.addButton(self.plain_radio)
+
+        # Connect signal for immediate theme change and auto-save
+        self._theme_group.buttonToggled.connect(self._on_theme_toggled)
 
         radio_layout.addWidget(self.gradient_radio)
         radio_layout.addWidget(self.plain_radio)
@@ -281,92 +427,26 @@ class OnboardingWindow(ThemeAwareMixin, ThemedWidget):
     def _create_next_button(self):
         """Create the 'Next' button that proceeds to API configuration step."""
         next_button = QtWidgets.QPushButton(_("Next"))
-        next_button.setStyleSheet(self._get_button_style())
+        next_button.setObjectName("next_button")  # Matched by the window stylesheet
         # Connect to navigation handler (proceeds to API setup)
         next_button.clicked.connect(self._on_next_clicked)
         return next_button
 
-    def _get_content_style(self):
-        """Get the content styling based on current theme (dark/light mode)."""
-        current_mode = self._get_effective_mode()
-        color = '#ffffff' if current_mode == 'dark' else '#333333'
-        style = f"font-size: 16px; color: {color};"
-        return style
-
-    def _get_info_style(self):
-        """Get the info text styling based on current theme (dark/light mode)."""
-        current_mode = self._get_effective_mode()
-        color = '#aaaaaa' if current_mode == 'dark' else '#666666'
-        style = f"font-size: 16px; color: {color}; font-style: italic; margin: 10px 0;"
-        return style
-
-    def _get_input_style(self):
-        """Get the input field styling based on current theme."""
-        current_mode = self._get_effective_mode()
-        return f"""
-            font-size: 16px;
-            padding: 5px;
-            background-color: {'#444' if current_mode == 'dark' else 'white'};
-            color: {'#ffffff' if current_mode == 'dark' else '#000000'};
-            border: 1px solid {'#666' if current_mode == 'dark' else '#ccc'};
-        """
-
-    def _get_radio_style(self):
-        """Get the radio button styling based on current theme."""
-        current_mode = self._get_effective_mode()
-        color = '#ffffff' if current_mode == 'dark' else '#333333'
-        style = f"color: {color};"
-        return style
-
-    def _get_dropdown_style(self):
-        """Get the dropdown styling based on current theme."""
+    def _get_stylesheet(self):
+        """Get the window stylesheet for the current effective color mode (built once per mode)."""
         current_mode = self._get_effective_mode()
-        if current_mode == 'dark':
-            return """
-                QComboBox {
-                    background-color: #444;
-                    color: #ffffff;
-                    border: 1px solid #666;
-                    padding: 5px;
-                    font-size: 14px;
-                }
-                QComboBox QAbstractItemView {
-                    background-color: #444;
-                    color: #ffffff;
-                    selection-background-color: #666;
-                }
-            """
-        else:
-            return """
-                QComboBox {
-                    background-color: white;
-                    color: #000000;
-                    border: 1px solid #ccc;
-                    padding: 5px;
-                    font-size: 14px;
-                }
-                QComboBox QAbstractItemView {
-                    background-color: white;
-                    color: #000000;
-                    selection-background-color: #e0e0e0;
-                }
-            """
-
-    def _get_button_style(self):
-        """Get the button styling with hover effects."""
-        return """
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                padding: 10px;
-                font-size: 16px;
-                border: none;
-                border-radius: 5px;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-        """
+        stylesheet = self._stylesheet_cache.get(current_mode)
+        if stylesheet is None:
+            stylesheet = self._stylesheet_cache[current_mode] = self._build_stylesheet(current_mode)
+        return stylesheet
+
+    @staticmethod
+    def _build_stylesheet(current_mode):
+        """Build the stylesheet covering every themed widget of the window for the given color mode."""
+        stylesheet = _WINDOW_QSS_TEMPLATE
+        for variable, value in _PALETTES['dark' if current_mode == 'dark' else 'light'].items():
+            stylesheet = stylesheet.replace(variable, value)
+        return stylesheet
 
     def _on_shortcut_changed(self):
         """Handle shortcut input changes and save automatically to settings."""
@@ -376,18 +456,22 @@ class OnboardingWindow(ThemeAwareMixin, ThemedWidget):
         else:
             self.shortcut = "ctrl+space"  # Fallback to default if empty
 
-        # Auto-save shortcut setting immediately
-        self._save_shortcut_setting()
+        # Auto-save shortcut setting once typing pauses (restarts the countdown)
+        self._shortcut_save_timer.start()
 
-    def _on_theme_changed(self):
+    def _on_theme_toggled(self, button, checked):
         """Handle theme selection changes, apply immediately and save to settings."""
+        # Ignore the notification for the button being unchecked
+        if not checked:
+            return
+
         # Determine the newly selected theme
-        new_theme = "gradient" if self.gradient_radio.isChecked() else "plain"
+        new_theme = "gradient" if button is self.gradient_radio else "plain"
 
         if new_theme != self.theme:
             self.theme = new_theme
 
-            # Auto-save theme setting immediately
+            # Auto-save theme setting (flushed to disk once toggling settles)
             self._save_theme_setting()
 
             # Apply theme change to UI immediately (live preview)
@@ -400,92 +484,81 @@ class OnboardingWindow(ThemeAwareMixin, ThemedWidget):
         # Force background redraw to show new theme
         self.background.update()
 
-    def auto_save_color_mode(self):
+    @QtCore.Slot(int)
+    def auto_save_color_mode(self, _index):
         """
         Auto-save color mode when it changes for immediate visual feedback.
         Preserves existing data and ensures proper persistence.
         """
         if hasattr(self, "color_mode_dropdown") and self.color_mode_dropdown is not None:
-            # Get the selected text and convert to internal format
-            selected_text = self.color_mode_dropdown.currentText()
-            mode_mapping = {_("Auto"): "auto", _("Light"): "light", _("Dark"): "dark"}
-            color_mode = mode_mapping.get(selected_text, "auto")
+            # The internal format is stored as the selected item's user data
+            color_mode = self.color_mode_dropdown.currentData() or "auto"
+
+            # Nothing to do if the user re-selected the active mode
+            if color_mode == (self.app.settings_manager.color_mode or "auto"):
+                return
 
             # Save to settings manager (this preserves existing data in data.json)
             self.app.settings_manager.color_mode = color_mode
 
-            # IMPORTANT: Explicitly save to file to ensure persistence
-            self.app.settings_manager.save()
+            # Apply shortly after, so that a burst of quick changes applies only the last one
+            self._mode_apply_timer.start()
 
-            # Update global colorMode variable
-            from ui.ui_utils import set_color_mode
+    def _apply_color_mode_change(self):
+        """Persist and apply the selected color mode to the whole application."""
+        self._mode_apply_timer.stop()
+        color_mode = self.app.settings_manager.color_mode or "auto"
 
-            set_color_mode(color_mode)
+        # IMPORTANT: Explicitly save to file to ensure persistence
+        self.app.settings_manager.save()
 
-            # Apply color mode change immediately via centralized theme manager
-            from ui.ThemeManager import theme_manager
+        # Update global colorMode variable
+        from ui.ui_utils import set_color_mode
 
-            theme_manager.change_theme(color_mode)
+        set_color_mode(color_mode)
+        self._effective_mode_cache = None
 
-            # Refresh UI styles with updated colorMode
-            self._refresh_ui_styles()
+        # Apply color mode change via centralized theme manager
+        # (this also refreshes this window's styles, as it is registered with it)
+        from ui.ThemeManager import theme_manager
+
+        theme_manager.change_theme(color_mode)
 
     def _refresh_ui_styles(self):
         """Refresh all UI element styles to reflect the current color mode."""
-        # Update color mode dropdown style
-        if hasattr(self, 'color_mode_dropdown') and self.color_mode_dropdown:
-            self.color_mode_dropdown.setStyleSheet(self._get_dropdown_style())
-
-        # Update other UI elements
-        if hasattr(self, 'shortcut_input') and self.shortcut_input:
-            self.shortcut_input.setStyleSheet(self._get_input_style())
-
-        # Update radio buttons
-        if hasattr(self, 'gradient_radio') and self.gradient_radio:
-            radio_style = self._get_radio_style()
-            self.gradient_radio.setStyleSheet(radio_style)
-            self.plain_radio.setStyleSheet(radio_style)
-
-        # Update title label
-        if hasattr(self, 'title_label'):
-            for widget in self.findChildren(QtWidgets.QLabel):
-                if widget.objectName() == "title_label":
-                    widget.setStyleSheet(self._get_title_style())
-
-        # Update all content labels
-        for widget in self.findChildren(QtWidgets.QLabel):
-            if widget != self.color_mode_dropdown and not widget.objectName() == "title_label":
-                widget.setStyleSheet(self._get_content_style())
-
-        # Update specific labels with their appropriate styles
-        for widget in self.findChildren(QtWidgets.QLabel):
-            if widget.objectName() == "title_label":
-                widget.setStyleSheet(self._get_title_style())
-            elif widget.objectName() != "":  # Skip background widgets but apply content style to others
-                widget.setStyleSheet(self._get_content_style())
-
-        # Force background update
         if hasattr(self, 'background') and self.background:
+            # One stylesheet swap restyles every widget, no child traversal needed
+            self.background.setStyleSheet(self._get_stylesheet())
             self.background.update()
 
     def _save_shortcut_setting(self):
-        """Save only the shortcut setting to persistent storage."""
+        """Save only the shortcut setting and schedule a flush to persistent storage."""
         try:
             self.app.settings_manager.hotkey = self.shortcut
-            logging.debug(f"Shortcut setting saved: {self.shortcut}")
+            self._settings_flush_timer.start()
+            logger.debug("Shortcut setting saved: %s", self.shortcut)
         except Exception as e:
-            logging.error(f"Failed to save shortcut setting: {e}")
+            logger.error("Failed to save shortcut setting: %s", e)
 
     def _save_theme_setting(self):
-        """Save only the theme setting to persistent storage."""
+        """Save only the theme setting and schedule a flush to persistent storage."""
         try:
             self.app.settings_manager.theme = self.theme
+            self._settings_flush_timer.start()
+        except Exception as e:
+            logger.error("Failed to save theme setting: %s", e)
+
+    def _flush_settings(self):
+        """Write the in-memory settings to disk (single write per burst of changes)."""
+        self._settings_flush_timer.stop()
+        try:
+            self.app.settings_manager.save()
         except Exception as e:
-            logging.error(f"Failed to save theme setting: {e}")
+            logger.error("Failed to flush onboarding settings: %s", e)
 
     def _on_next_clicked(self):
         """Handle 'Next' button click - navigate to API configuration step."""
-        logging.debug("Proceeding to next step of onboarding")
+        logger.debug("Proceeding to next step of onboarding")
 
         # Settings are already auto-saved, no need to save again
         # Navigate to API key configuration screen
@@ -496,27 +569,40 @@ class OnboardingWindow(ThemeAwareMixin, ThemedWidget):
         try:
             self.app.settings_manager.hotkey = self.shortcut
             self.app.settings_manager.theme = self.theme
-            logging.debug("Settings saved successfully")
+            logger.debug("Settings saved successfully")
         except Exception as e:
-            logging.error(f"Failed to save settings: {e}")
+            logger.error("Failed to save settings: %s", e)
 
     def _show_api_key_input(self):
         """Navigate to API key configuration screen and close this window."""
         # Open settings window focused on provider configuration
         self.app.show_settings(providers_only=True)
-        # Mark as self-closing to avoid emitting close signal
-        self.self_close = True
+        # Navigating away is not a user close: detach close_signal listeners first
+        try:
+            self.close_signal.disconnect()
+        except (RuntimeError, TypeError):
+            pass  # Nothing was connected
         # Close this onboarding window
         self.close()
 
     def closeEvent(self, event):
         """Handle window close events - distinguish between user close and navigation."""
-        # Only emit close signal if user manually closed (not navigating to next step)
-        if not self.self_close:
-            self.close_signal.emit()
+        # Don't lose pending settings writes when the window goes away
+        if self._mode_apply_timer.isActive():
+            self._apply_color_mode_change()
+        if self._shortcut_save_timer.isActive():
+            self._shortcut_save_timer.stop()
+            self._save_shortcut_setting()
+        if self._settings_flush_timer.isActive():
+            self._flush_settings()
+
+        # Listeners are disconnected beforehand when navigating to the next step
+        self.close_signal.emit()
         super().closeEvent(event)
 
     def refresh_theme(self):
         """Appelé automatiquement quand le thème change via ThemeManager."""
+        # Le mode effectif a pu changer (réglage utilisateur ou thème du système)
+        self._effective_mode_cache = None
         # Utiliser l'ancienne méthode pour l'instant, sera refactorisée plus tard
         self._refresh_ui_styles()
@@ -4,31 +4,81 @@ Progress Window for long-running operations like Ollama installation.
 
 import logging
 from PySide6 import QtCore, QtWidgets
-from PySide6.QtCore import QTimer
 from PySide6.QtWidgets import QDialog, QVBoxLayout, QLabel, QProgressBar, QPushButton
 
 from ui.ui_utils import get_effective_color_mode
 
 
+def _build_stylesheet(bg_color, text_color, button_bg, button_hover, progress_bg):
+    """Build the progress window stylesheet for one color palette."""
+    return f"""
+        QDialog {{
+            background-color: {bg_color};
+            color: {text_color};
+        }}
+        QLabel {{
+            font-size: 14px;
+            color: {text_color};
+        }}
+        QPushButton {{
+            background-color: {button_bg};
+            color: white;
+            padding: 8px 16px;
+            font-size: 12px;
+            border: none;
+            border-radius: 4px;
+        }}
+        QPushButton:hover {{
+            background-color: {button_hover};
+        }}
+        QProgressBar {{
+            background-color: {progress_bg};
+            border: 1px solid #cccccc;
+            border-radius: 4px;
+            text-align: center;
+        }}
+        QProgressBar::chunk {{
+            background-color: {button_bg};
+            border-radius: 3px;
+        }}
+    """
+
+
+# Only two variants exist, so both are built once at import time
+_DARK_QSS = _build_stylesheet(
+    bg_color='#2b2b2b',
+    text_color='#ffffff',
+    button_bg='#4CAF50',
+    button_hover='#45a049',
+    progress_bg='#444444',
+)
+_LIGHT_QSS = _build_stylesheet(
+    bg_color='#ffffff',
+    text_color='#333333',
+    button_bg='#008CBA',
+    button_hover='#007095',
+    progress_bg='#f0f0f0',
+)
+
+
 class ProgressWindow(QDialog):
     """
-    A progress window with animated loading dots for long-running operations.
+    A progress window with an animated (indeterminate) progress bar for long-running operations.
+    The animation is driven by the Qt style itself, no Python timer is involved.
     """
     
     # Signal emitted when user cancels the operation
     cancelled = QtCore.Signal()
     
-    def __init__(self, title="Opération en cours", message="Veuillez patienter", parent=None):
+    def __init__(self, title="Opération en cours", message="Veuillez patienter", parent=None, color_mode=None):
         super().__init__(parent)
         self.setWindowTitle(title)
         self.setModal(True)
         self.setFixedSize(400, 150)
         
-        # Animation state
-        self.dots_count = 0
         self.base_message = message
-        self.timer = QTimer()
-        self.timer.timeout.connect(self._update_dots)
+        # Resolved once per window; callers may pass a mode they already know
+        self.color_mode = color_mode or get_effective_color_mode()
         
         self._setup_ui()
         self._apply_theme()
@@ -39,15 +89,16 @@ class ProgressWindow(QDialog):
         layout.setSpacing(20)
         layout.setContentsMargins(30, 30, 30, 30)
         
-        # Message label with animated dots
+        # Message label
         self.message_label = QLabel(self.base_message)
         self.message_label.setWordWrap(True)
         self.message_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(self.message_label)
         
-        # Progress bar (indeterminate)
+        # Progress bar (indeterminate while an animation is running)
         self.progress_bar = QProgressBar()
         self.progress_bar.setRange(0, 0)  # Indeterminate progress
+        self.progress_bar.setTextVisible(False)
         layout.addWidget(self.progress_bar)
         
         # Cancel button
@@ -57,72 +108,21 @@ class ProgressWindow(QDialog):
         
     def _apply_theme(self):
         """Apply the current theme to the window."""
-        current_mode = get_effective_color_mode()
-        
-        if current_mode == 'dark':
-            bg_color = '#2b2b2b'
-            text_color = '#ffffff'
-            button_bg = '#4CAF50'
-            button_hover = '#45a049'
-            progress_bg = '#444444'
-        else:
-            bg_color = '#ffffff'
-            text_color = '#333333'
-            button_bg = '#008CBA'
-            button_hover = '#007095'
-            progress_bg = '#f0f0f0'
-        
-        self.setStyleSheet(f"""
-            QDialog {{
-                background-color: {bg_color};
-                color: {text_color};
-            }}
-            QLabel {{
-                font-size: 14px;
-                color: {text_color};
-            }}
-            QPushButton {{
-                background-color: {button_bg};
-                color: white;
-                padding: 8px 16px;
-                font-size: 12px;
-                border: none;
-                border-radius: 4px;
-            }}
-            QPushButton:hover {{
-                background-color: {button_hover};
-            }}
-            QProgressBar {{
-                background-color: {progress_bg};
-                border: 1px solid #cccccc;
-                border-radius: 4px;
-                text-align: center;
-            }}
-            QProgressBar::chunk {{
-                background-color: {button_bg};
-                border-radius: 3px;
-            }}
-        """)
+        self.setStyleSheet(_DARK_QSS if self.color_mode == 'dark' else _LIGHT_QSS)
         
     def start_animation(self):
-        """Start the dots animation."""
-        self.timer.start(500)  # Update every 500ms
+        """Start the busy animation (indeterminate progress bar, animated by Qt)."""
+        self.progress_bar.setRange(0, 0)
         
     def stop_animation(self):
-        """Stop the dots animation."""
-        self.timer.stop()
-        
-    def _update_dots(self):
-        """Update the animated dots."""
-        self.dots_count = (self.dots_count + 1) % 4
-        dots = "." * self.dots_count
-        self.message_label.setText(f"{self.base_message}{dots}")
+        """Stop the busy animation."""
+        self.progress_bar.setRange(0, 1)
+        self.progress_bar.setValue(1)
         
     def update_message(self, message):
         """Update the message text."""
         self.base_message = message
-        self.dots_count = 0
-        self._update_dots()
+        self.message_label.setText(message)
         
     def _on_cancel(self):
         """Handle cancel button click."""
@@ -140,11 +140,12 @@ class OllamaInstallProgressWindow(ProgressWindow):
     Specialized progress window for Ollama installation.
     """
     
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, color_mode=None):
         super().__init__(
             title="Installation d'Ollama",
             message="Téléchargement d'Ollama en cours",
-            parent=parent
+            parent=parent,
+            color_mode=color_mode
         )
         
     def set_downloading(self):
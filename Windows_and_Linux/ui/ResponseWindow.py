@@ -1,9 +1,18 @@
+import functools
 import logging
+import threading
 from typing import TYPE_CHECKING, Optional
 
 import markdown2
+
+# Faster Markdown parser, used instead of markdown2 when installed
+try:
+    import mistune
+except ImportError:
+    mistune = None
+
 from PySide6 import QtCore, QtGui
-from PySide6.QtCore import Qt, Slot
+from PySide6.QtCore import QMimeData, QRunnable, QThreadPool, Qt, Slot
 from PySide6.QtWidgets import (
     QScrollArea,
     QVBoxLayout,
@@ -18,13 +27,234 @@ from PySide6.QtWidgets import (
     QLineEdit,
 )
 
-from ui.ui_utils import ThemedWidget, get_effective_color_mode
+from ui.ui_utils import ThemedWidget, get_effective_color_mode, get_icon_path
 
 if TYPE_CHECKING:
     from Windows_and_Linux.WritingToolApp import WritingToolApp
 
 _ = lambda x: x
 
+# Shared converter with table support, built once. For markdown2, building a Markdown
+# instance registers the extras and compiles its patterns, convert() only resets the
+# per-document state. Raw HTML is kept as markdown2 does. Calls go through _render_md,
+# which serializes them since long messages are converted on the thread pool.
+if mistune is not None:
+    _md_to_html = mistune.create_markdown(escape=False, plugins=["table"])
+else:
+    _md_to_html = markdown2.Markdown(extras=["tables"]).convert
+
+
+# Window stylesheet, with @variables substituted from the color mode palette.
+# Widgets are matched by object name; message browsers also by their "user_message" property.
+_WINDOW_QSS_TEMPLATE = """
+    QLabel#title_label {
+        font-size: 20px;
+        font-weight: bold;
+        color: @title;
+    }
+    QLabel#zoom_label {
+        color: @hint;
+        font-size: 14px;
+        margin-right: 5px;
+    }
+    QLabel#copy_hint {
+        color: @hint;
+        font-size: 14px;
+    }
+    QLabel#thinking_label {
+        color: @title;
+        font-size: 18px;
+        padding: 20px;
+    }
+    QPushButton#zoom_button {
+        background-color: @button_bg;
+        color: @text;
+        border: 1px solid @button_border;
+        border-radius: 5px;
+        padding: 8px;
+        font-size: 14px;
+    }
+    QPushButton#zoom_button:hover {
+        background-color: @button_hover;
+    }
+    QLineEdit#input_field {
+        padding: 8px;
+        border: 1px solid @input_border;
+        border-radius: 8px;
+        background-color: @browser_bg;
+        color: @text;
+        font-size: 14px;
+    }
+    QPushButton#send_button {
+        background-color: @send_bg;
+        border: none;
+        border-radius: 8px;
+        padding: 5px;
+    }
+    QPushButton#send_button:hover {
+        background-color: @send_hover;
+    }
+    QTextBrowser#md_browser {
+        background-color: @browser_bg;
+        color: @text;
+        border: 1px solid @browser_border;
+        border-radius: 8px;
+        padding: 8px;
+        margin: 0px;
+        line-height: 1.3;
+        width: 100%;
+    }
+    QTextBrowser#md_browser[user_message="true"] {
+        background-color: transparent;
+        border: none;
+    }
+    QToolButton#copy_button {
+        background-color: @copy_bg;
+        border: 1px solid @button_border;
+        border-radius: 6px;
+        padding: 2px;
+        margin: 0px;
+        spacing: 0px;
+    }
+    QToolButton#copy_button:hover {
+        background-color: @copy_hover_bg;
+        border: 1px solid @copy_hover_border;
+    }
+
+    /* Table styles */
+    table {
+        border-collapse: collapse;
+        width: 100%;
+        margin: 10px 0;
+    }
+
+    th, td {
+        border: 1px solid @browser_border;
+        padding: 8px;
+        text-align: left;
+    }
+
+    th {
+        background-color: @th_bg;
+        font-weight: bold;
+    }
+
+    tr:nth-child(even) {
+        background-color: @tr_even;
+    }
+
+    tr:hover {
+        background-color: @tr_hover;
+    }
+"""
+
+_PALETTES = {
+    'dark': {
+        '@title': '#ffffff',
+        '@hint': '#aaaaaa',
+        '@text': '#ffffff',
+        '@button_bg': '#444',
+        '@button_hover': '#555',
+        '@button_border': '#666',
+        '@input_border': '#777',
+        '@browser_bg': '#333',
+        '@browser_border': '#555',
+        '@send_bg': '#2e7d32',
+        '@send_hover': '#1b5e20',
+        '@copy_bg': 'rgba(68, 68, 68, 0.9)',
+        '@copy_hover_bg': 'rgba(85, 85, 85, 0.9)',
+        '@copy_hover_border': '#777',
+        '@th_bg': '#444',
+        '@tr_even': '#3a3a3a',
+        '@tr_hover': '#484848',
+    },
+    'light': {
+        '@title': '#333333',
+        '@hint': '#666666',
+        '@text': '#212529',
+        '@button_bg': '#f8f9fa',
+        '@button_hover': '#e9ecef',
+        '@button_border': '#dee2e6',
+        '@input_border': '#dee2e6',
+        '@browser_bg': '#f8f9fa',
+        '@browser_border': '#dee2e6',
+        '@send_bg': '#4CAF50',
+        '@send_hover': '#45a049',
+        '@copy_bg': 'rgba(248, 249, 250, 0.95)',
+        '@copy_hover_bg': 'rgba(233, 236, 239, 0.95)',
+        '@copy_hover_border': '#adb5bd',
+        '@th_bg': '#e9ecef',
+        '@tr_even': '#f8f9fa',
+        '@tr_hover': '#e9ecef',
+    },
+}
+
+
+_md_lock = threading.Lock()
+
+# Messages at least this long are converted on the thread pool instead of the GUI thread
+_THREADED_RENDER_MIN_LENGTH = 2000
+
+# Longest conversation kept by a response window, the oldest follow-up messages are dropped first
+_MAX_CHAT_HISTORY = 5000
+# Leading messages never dropped: the original text and the first response, which follow-ups
+# and "copy first response" rely on
+_CHAT_HISTORY_KEPT_HEAD = 2
+
+# Role labels of the conversation copied as Markdown
+_USER_PREFIX = "**User**: "
+_ASSISTANT_PREFIX = "**Assistant**: "
+
+
+@functools.lru_cache(maxsize=256)
+def _render_md(text: str) -> str:
+    """Convert message Markdown to HTML, reusing the result for text already rendered"""
+    with _md_lock:
+        return _md_to_html(text)
+
+
+@functools.lru_cache(maxsize=32)
+def _cached_icon(name: str, color_mode: str) -> QtGui.QIcon:
+    """Themed icon for the given color mode, loaded once and shared by every button using it"""
+    return QtGui.QIcon(get_icon_path(name, with_theme=True))
+
+
+class _ChatHistory(list):
+    """
+    Conversation as role/content dicts, bounded to _MAX_CHAT_HISTORY messages.
+    Stays a list so the follow-up thread can append while the GUI thread reads it.
+    """
+
+    def __init__(self, messages=()):
+        super().__init__(messages)
+        excess = len(self) - _MAX_CHAT_HISTORY
+        if excess > 0:
+            del self[_CHAT_HISTORY_KEPT_HEAD : _CHAT_HISTORY_KEPT_HEAD + excess]
+
+    def append(self, message):
+        super().append(message)
+        if len(self) > _MAX_CHAT_HISTORY:
+            # Drop the oldest follow-up message
+            del self[_CHAT_HISTORY_KEPT_HEAD]
+
+
+class _MarkdownRenderSignals(QtCore.QObject):
+    """Signals of _MarkdownRenderTask, delivered in the GUI thread"""
+
+    rendered = QtCore.Signal(str, str)  # Markdown text, HTML
+
+
+class _MarkdownRenderTask(QRunnable):
+    """Convert a message to HTML on a QThreadPool thread"""
+
+    def __init__(self, text):
+        super().__init__()
+        self.text = text
+        self.signals = _MarkdownRenderSignals()
+
+    def run(self):
+        self.signals.rendered.emit(self.text, _render_md(self.text))
+
 
 class MarkdownTextBrowser(QTextBrowser):
     """Enhanced text browser for displaying Markdown content with improved sizing"""
@@ -36,6 +266,19 @@ class MarkdownTextBrowser(QTextBrowser):
         self.zoom_factor = 1.2
         self.base_font_size = 14
         self.is_user_message = is_user_message
+        self.setObjectName("md_browser")
+        self.setProperty("user_message", is_user_message)
+        # Document heights per text width, valid for the (revision, zoom factor) in _size_cache_key
+        self._size_cache: dict[float, float] = {}
+        self._size_cache_key = None
+        # Owners and position in the chat, set by ChatContentScrollArea.add_message
+        self._scroll_area: Optional['ChatContentScrollArea'] = None
+        self._response_window: Optional['ResponseWindow'] = None
+        self._message_index = -1
+        # Markdown source of the current (or pending) content
+        self._markdown_text: Optional[str] = None
+        # True while the HTML of a long message is being converted on the thread pool
+        self.render_pending = False
 
         # Critical: Remove scrollbars to prevent extra space
         self.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
@@ -50,89 +293,95 @@ class MarkdownTextBrowser(QTextBrowser):
         self._apply_zoom()
 
     def _apply_zoom(self):
+        # Colors come from the ResponseWindow stylesheet; zooming only changes the font,
+        # so no stylesheet has to be parsed and re-polished per step
         new_size = int(self.base_font_size * self.zoom_factor)
-
-        # Updated stylesheet with table styling
-        from ui.ui_utils import get_effective_color_mode
-
-        current_mode = get_effective_color_mode()
-
-        self.setStyleSheet(
-            f"""
-            QTextBrowser {{
-                background-color: {('transparent' if self.is_user_message else '#333' if current_mode == 'dark' else '#f8f9fa')};
-                color: {'#ffffff' if current_mode == 'dark' else '#212529'};
-                border: {('none' if self.is_user_message else '1px solid ' + ('#555' if current_mode == 'dark' else '#dee2e6'))};
-                border-radius: 8px;
-                padding: 8px;
-                margin: 0px;
-                font-size: {new_size}px;
-                line-height: 1.3;
-                width: 100%;
-            }}
-
-            /* Table styles */
-            table {{
-                border-collapse: collapse;
-                width: 100%;
-                margin: 10px 0;
-            }}
-
-            th, td {{
-                border: 1px solid {'#555' if current_mode == 'dark' else '#dee2e6'};
-                padding: 8px;
-                text-align: left;
-            }}
-
-            th {{
-                background-color: {'#444' if current_mode == 'dark' else '#e9ecef'};
-                font-weight: bold;
-            }}
-
-            tr:nth-child(even) {{
-                background-color: {'#3a3a3a' if current_mode == 'dark' else '#f8f9fa'};
-            }}
-
-            tr:hover {{
-                background-color: {'#484848' if current_mode == 'dark' else '#e9ecef'};
-            }}
-        """,
-        )
+        font = self.font()
+        if font.pixelSize() != new_size:
+            font.setPixelSize(new_size)
+            self.setFont(font)
+
+    def document_height(self, text_width):
+        """Set the document text width and return the content height, laid out once per width"""
+        document = self.document()
+        document.setTextWidth(text_width)
+
+        # Heights stay valid until the content or the zoom changes
+        cache_key = (document.revision(), self.zoom_factor)
+        if cache_key != self._size_cache_key:
+            self._size_cache_key = cache_key
+            self._size_cache.clear()
+
+        height = self._size_cache.get(text_width)
+        if height is None:
+            height = self._size_cache[text_width] = document.size().height()
+        return height
 
     def _update_size(self):
         # Calculate correct document width
         available_width = self.viewport().width() - 16  # Account for padding
-        self.document().setTextWidth(available_width)
 
         # Get precise content height
-        doc_size = self.document().size()
-        content_height = doc_size.height()
+        content_height = self.document_height(available_width)
 
         # Add minimal padding for content
         new_height = int(content_height + 16)  # Reduced total padding
 
         if self.minimumHeight() != new_height:
-            self.setMinimumHeight(new_height)
-            self.setMaximumHeight(new_height)  # Force fixed height
+            self.setFixedHeight(new_height)  # Force fixed height
 
             # Update scroll area if needed
             scroll_area = self.get_scroll_area()
             if scroll_area:
+                scroll_area.update_message_height(self)
                 scroll_area.update_content_height()
 
+    def set_markdown(self, text):
+        """Render Markdown text into the browser, skipping text that is already shown"""
+        if text == self._markdown_text:
+            return
+        self._markdown_text = text
+
+        if len(text) < _THREADED_RENDER_MIN_LENGTH:
+            self.render_pending = False
+            self.setHtml(_render_md(text))
+            if self.isVisible():
+                self._update_size()
+        else:
+            # Long messages are parsed off the GUI thread, the browser is filled in once done
+            self.render_pending = True
+            render_task = _MarkdownRenderTask(text)
+            render_task.signals.rendered.connect(self.set_rendered_html)
+            QThreadPool.globalInstance().start(render_task)
+
+    @Slot(str, str)
+    def set_rendered_html(self, text, html):
+        """Show HTML converted on the thread pool and resize to it, unless newer text was set since"""
+        if text != self._markdown_text:
+            return
+        self.render_pending = False
+        self.setHtml(html)
+        self._update_size()
+        scroll_area = self._scroll_area
+        if scroll_area:
+            # The message was measured while still empty, so measure it again with its content
+            scroll_area.update_message_height(self)
+            scroll_area.update_content_height()
+            QtCore.QTimer.singleShot(0, scroll_area.post_message_updates)
+        # A window waiting for this first response to fit its height can now be sized
+        if self._response_window is not None:
+            self._response_window._schedule_height_adjust()
+
     def wheelEvent(self, event):
         if event.modifiers() == Qt.KeyboardModifier.ControlModifier:
             delta = event.angleDelta().y()
             # Get the main response window
-            parent = self.parent()
-            while parent and not isinstance(parent, ResponseWindow):
-                parent = parent.parent()
-
-            if parent:
+            response_window = self._response_window
+            if response_window:
                 if delta > 0:
-                    parent.zoom_all_messages("in")
+                    response_window.zoom_all_messages("in")
                 else:
-                    parent.zoom_all_messages("out")
+                    response_window.zoom_all_messages("out")
                 event.accept()
         # Pass wheel events to parent for scrolling
         else:
@@ -161,14 +410,22 @@ class MarkdownTextBrowser(QTextBrowser):
             self._apply_zoom()
             self._update_size()
 
+    def zoom_steps(self, steps, reset=False):
+        """Apply zoom in (positive) or out (negative) steps, after an optional reset, in one relayout"""
+        new_factor = 1.2 if reset else self.zoom_factor
+        for _step in range(abs(steps)):
+            if steps > 0:
+                new_factor = min(3.0, new_factor * 1.1)
+            else:
+                new_factor = max(0.5, new_factor / 1.1)
+        if new_factor != self.zoom_factor:
+            self.zoom_factor = new_factor
+            self._apply_zoom()
+            self._update_size()
+
     def get_scroll_area(self):
-        """Find the parent ChatContentScrollArea"""
-        parent = self.parent()
-        while parent:
-            if isinstance(parent, ChatContentScrollArea):
-                return parent
-            parent = parent.parent()
-        return None
+        """Return the ChatContentScrollArea holding this message"""
+        return self._scroll_area
 
     def resizeEvent(self, event):
         super().resizeEvent(event)
@@ -178,6 +435,16 @@ class MarkdownTextBrowser(QTextBrowser):
 class MessageContainer(QWidget):
     """Container for individual messages with copy functionality"""
 
+    # Success feedback style, shown briefly on the copy button after a copy
+    _SUCCESS_STYLE = """
+        QToolButton {
+            background-color: rgba(76, 175, 80, 0.9);
+            border: 1px solid #4CAF50;
+            border-radius: 6px;
+            padding: 2px;
+        }
+    """
+
     def __init__(self, parent=None, is_user=False, text="", text_display=None):
         super().__init__(parent)
         self.markdown_text = text
@@ -198,50 +465,26 @@ class MessageContainer(QWidget):
         # Add copy button for assistant messages only (positioned absolutely)
         if not is_user:
             self.copy_btn = QToolButton(self)
+            self.copy_btn.setObjectName("copy_button")
             # Use the copy_md icon (SVG format with theme support)
-            from ui.ui_utils import get_icon_path
-
-            icon_path = get_icon_path("copy_md", with_theme=True)
-            self.copy_btn.setIcon(QtGui.QIcon(icon_path))
-            from ui.ui_utils import get_effective_color_mode
-
-            current_mode = get_effective_color_mode()
-
-            self.copy_btn.setStyleSheet(
-                f"""
-                QToolButton {{
-                    background-color: {'rgba(68, 68, 68, 0.9)' if current_mode == 'dark' else 'rgba(248, 249, 250, 0.95)'};
-                    border: 1px solid {'#666' if current_mode == 'dark' else '#dee2e6'};
-                    border-radius: 6px;
-                    padding: 2px;
-                    margin: 0px;
-                    spacing: 0px;
-                }}
-                QToolButton:hover {{
-                    background-color: {'rgba(85, 85, 85, 0.9)' if current_mode == 'dark' else 'rgba(233, 236, 239, 0.95)'};
-                    border: 1px solid {'#777' if current_mode == 'dark' else '#adb5bd'};
-                }}
-            """,
-            )
+            self.copy_btn.setIcon(_cached_icon("copy_md", get_effective_color_mode()))
             self.copy_btn.setToolTip(_("Copy as Markdown"))
             self.copy_btn.clicked.connect(self.copy_content)
             self.copy_btn.setFixedSize(32, 32)
             self.copy_btn.setIconSize(QtCore.QSize(24, 24))
             self.copy_btn.hide()  # Initially hidden
 
-            # Install event filter to handle hover
-            self.installEventFilter(self)
+    def enterEvent(self, event):
+        """Show the copy button while the mouse is over the message"""
+        if not self.is_user:
+            self.copy_btn.show()
+        super().enterEvent(event)
 
-    def eventFilter(self, obj, event):
-        """Handle mouse enter/leave events to show/hide copy button"""
-        if obj == self and not self.is_user:
-            if event.type() == QtCore.QEvent.Type.Enter:
-                if hasattr(self, "copy_btn"):
-                    self.copy_btn.show()
-            elif event.type() == QtCore.QEvent.Type.Leave:
-                if hasattr(self, "copy_btn"):
-                    self.copy_btn.hide()
-        return super().eventFilter(obj, event)
+    def leaveEvent(self, event):
+        """Hide the copy button when the mouse leaves the message"""
+        if not self.is_user:
+            self.copy_btn.hide()
+        super().leaveEvent(event)
 
     def resizeEvent(self, event):
         """Position the copy button in the top-right corner"""
@@ -260,26 +503,14 @@ class MessageContainer(QWidget):
 
         # Visual feedback: temporarily change button color
         if hasattr(self, "copy_btn"):
-            original_style = self.copy_btn.styleSheet()
-
-            # Success feedback style
-            success_style = f"""
-                QToolButton {{
-                    background-color: rgba(76, 175, 80, 0.9);
-                    border: 1px solid #4CAF50;
-                    border-radius: 6px;
-                    padding: 2px;
-                }}
-            """
-
-            # Apply success style
-            self.copy_btn.setStyleSheet(success_style)
+            self.copy_btn.setStyleSheet(self._SUCCESS_STYLE)
 
             # Reset to original style after 500ms
-            QtCore.QTimer.singleShot(
-                500,
-                lambda: self.copy_btn.setStyleSheet(original_style),
-            )
+            QtCore.QTimer.singleShot(500, self._restore_copy_button_style)
+
+    def _restore_copy_button_style(self):
+        """Drop the success style, the button is styled by the window stylesheet again"""
+        self.copy_btn.setStyleSheet("")
 
 
 class ChatContentScrollArea(QScrollArea):
@@ -289,6 +520,17 @@ class ChatContentScrollArea(QScrollArea):
         super().__init__(parent)
         self.content_widget: Optional[QWidget] = None
         self.layout: Optional[QVBoxLayout] = None
+
+        # Height of each message container in chat order, and their running total
+        self._message_heights: list[int] = []
+        self._total_height = 0
+
+        # Relayout messages once the resize settles instead of on every step of a window drag
+        self._resize_timer = QtCore.QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(40)
+        self._resize_timer.timeout.connect(self._relayout_messages)
+
         self.setup_ui()
 
     def setup_ui(self):
@@ -356,8 +598,15 @@ class ChatContentScrollArea(QScrollArea):
 
         # Create text display first
         text_display = MarkdownTextBrowser(self.content_widget, is_user_message=is_user)
-        html = markdown2.markdown(text, extras=["tables"])
-        text_display.setHtml(html)
+        text_display._scroll_area = self
+        window = self.window()
+        response_window = window if isinstance(window, ResponseWindow) else None
+        text_display._response_window = response_window
+        text_display._message_index = len(self._message_heights)
+        # Start at the window's current zoom, set before the content so it is laid out once
+        if response_window is not None and response_window.current_text_display is not None:
+            ResponseWindow._set_display_zoom(text_display, response_window.current_text_display.zoom_factor)
+        text_display.set_markdown(text)
 
         # Wrap in MessageContainer for copy functionality
         msg_container = MessageContainer(
@@ -370,34 +619,33 @@ class ChatContentScrollArea(QScrollArea):
         self.layout.addWidget(msg_container)
         self.layout.addStretch()
 
-        parent = self.parent()
-        if hasattr(parent, "current_text_display") and isinstance(parent, ResponseWindow):
-            parent.current_text_display = text_display
+        height = msg_container.sizeHint().height()
+        self._message_heights.append(height)
+        self._total_height += height
+
+        # The chat area sits in the window background, so the window comes from self.window()
+        if response_window is not None:
+            response_window.current_text_display = text_display
 
-        QtCore.QTimer.singleShot(50, self.post_message_updates)
+        QtCore.QTimer.singleShot(0, self.post_message_updates)
 
         return text_display
 
     def post_message_updates(self):
         """Handle updates after adding a message with proper timing"""
         self.scroll_to_bottom()
-        parent = self.parent()
-        if isinstance(parent, ResponseWindow):
-            parent._adjust_window_height()
+        # The chat area sits in the window background, so its parent isn't the window
+        window = self.window()
+        if isinstance(window, ResponseWindow) and not hasattr(window, "_size_initialized"):
+            window._schedule_height_adjust()
 
     def update_content_height(self):
         """Recalculate total content height with improved spacing calculation"""
         if not self.layout:
             return
 
-        total_height = 0
-
-        # Calculate height of all messages
-        for i in range(self.layout.count() - 1):  # Skip stretch item
-            item = self.layout.itemAt(i)
-            if item and item.widget():
-                widget_height = item.widget().sizeHint().height()
-                total_height += widget_height
+        # Height of all messages, kept up to date by update_message_height
+        total_height = self._total_height
 
         # Add spacing between messages and margins
         total_height += self.layout.spacing() * (self.layout.count() - 2)  # Message spacing
@@ -407,10 +655,17 @@ class ChatContentScrollArea(QScrollArea):
         if self.content_widget:
             self.content_widget.setMinimumHeight(total_height + 10)
 
-        # Update window height if needed
-        parent = self.parent()
-        if isinstance(parent, ResponseWindow):
-            parent._adjust_window_height()
+        # Update window height if needed, once the layout has settled
+        window = self.window()
+        if isinstance(window, ResponseWindow) and not hasattr(window, "_size_initialized"):
+            window._schedule_height_adjust()
+
+    def update_message_height(self, text_display):
+        """Re-measure the message holding text_display and update the running content height"""
+        index = text_display._message_index
+        height = text_display.parentWidget().sizeHint().height()
+        self._total_height += height - self._message_heights[index]
+        self._message_heights[index] = height
 
     def scroll_to_bottom(self):
         """Smooth scroll to bottom of content"""
@@ -418,12 +673,20 @@ class ChatContentScrollArea(QScrollArea):
         vsb.setValue(vsb.maximum())
 
     def resizeEvent(self, event):
-        """Handle resize events with improved width calculations"""
+        """Handle resize events, the message relayout is deferred until resizing pauses"""
         super().resizeEvent(event)
+        self._resize_timer.start()
 
+    def _relayout_messages(self):
+        """Recalculate text width and height of every message for the current width"""
         if not self.layout:
             return
 
+        # Stay on the newest message if the view was showing it
+        vsb = self.verticalScrollBar()
+        at_bottom = vsb.value() == vsb.maximum()
+        resized = False
+
         # Update width for all message displays
         available_width = self.width() - 40  # Account for margins
         for i in range(self.layout.count() - 1):  # Skip stretch item
@@ -434,16 +697,26 @@ class ChatContentScrollArea(QScrollArea):
                     # Recalculate text width and height for MessageContainer
                     text_display = container.text_display
                     if text_display and text_display.document():
-                        text_display.document().setTextWidth(available_width)
-                        doc_size = text_display.document().size()
-                        exact_height = int(doc_size.height() + 20)  # Reduced padding
-                        text_display.setMinimumHeight(exact_height)
-                        text_display.setMaximumHeight(exact_height)  # Fixed height for all messages
+                        doc_height = text_display.document_height(available_width)
+                        exact_height = int(doc_height + 20)  # Reduced padding
+                        if (
+                            text_display.minimumHeight() != exact_height
+                            or text_display.maximumHeight() != exact_height
+                        ):
+                            text_display.setFixedHeight(exact_height)  # Fixed height for all messages
+                            self.update_message_height(text_display)
+                            resized = True
+
+        if resized and at_bottom:
+            QtCore.QTimer.singleShot(0, self.scroll_to_bottom)
 
 
 class ResponseWindow(ThemedWidget):
     """Enhanced response window with improved sizing and zoom handling"""
 
+    # Window stylesheet per color mode, shared by all response windows
+    _stylesheet_cache: dict[str, str] = {}
+
     def __init__(self, app: 'WritingToolApp', title=_("Response"), parent=None):
         super().__init__()
         self.app = app
@@ -460,11 +733,31 @@ class ResponseWindow(ThemedWidget):
 
         # Setup thinking animation with full range of dots
         self.thinking_timer = QtCore.QTimer(self)
+        self.thinking_timer.setTimerType(Qt.TimerType.CoarseTimer)  # Dots don't need precise ticks
         self.thinking_timer.timeout.connect(self.update_thinking_dots)
         self.thinking_dots_state = 0
         self.thinking_dots = ["", ".", "..", "..."]  # Now properly includes all states
         self.thinking_timer.setInterval(300)
 
+        # Zoom steps requested since the last flush; a burst of Ctrl+wheel ticks is applied at once
+        self._pending_zoom = 0
+        self._pending_zoom_reset = False
+        self._zoom_flush_timer = QtCore.QTimer(self)
+        self._zoom_flush_timer.setSingleShot(True)
+        self._zoom_flush_timer.setInterval(50)
+        self._zoom_flush_timer.timeout.connect(self._flush_zoom)
+
+        # Window height adjustment requested after a response; requests made while one
+        # is pending share it. Coarse, the timing does not need to be precise.
+        self._height_adjust_timer = QtCore.QTimer(self)
+        self._height_adjust_timer.setSingleShot(True)
+        self._height_adjust_timer.setTimerType(Qt.TimerType.CoarseTimer)
+        self._height_adjust_timer.setInterval(100)
+        self._height_adjust_timer.timeout.connect(self._adjust_window_height)
+
+        # Responses received while the window is hidden or minimized, added on the next show
+        self._pending_appends: list[str] = []
+
         self.init_ui()
         logging.debug("Connecting response signals")
         self.app.followup_response_signal.connect(self.handle_followup_response)
@@ -484,6 +777,8 @@ class ResponseWindow(ThemedWidget):
             | QtCore.Qt.WindowType.WindowMaximizeButtonHint,
         )
         self.setMinimumSize(600, 400)
+        current_mode = get_effective_color_mode()
+        self.setStyleSheet(self._get_stylesheet())
 
         # Main layout setup
         content_layout = QVBoxLayout(self.background)
@@ -494,23 +789,14 @@ class ResponseWindow(ThemedWidget):
         top_bar = QHBoxLayout()
 
         title_label = QLabel(self.option)
-        current_mode = get_effective_color_mode()
-        title_label.setStyleSheet(
-            f"font-size: 20px; font-weight: bold; color: {'#ffffff' if current_mode == 'dark' else '#333333'};",
-        )
+        title_label.setObjectName("title_label")
         top_bar.addWidget(title_label)
 
         top_bar.addStretch()
 
         # Zoom label with matched size
         zoom_label = QLabel("Zoom:")
-        zoom_label.setStyleSheet(
-            f"""
-            color: {'#aaaaaa' if current_mode == 'dark' else '#666666'};
-            font-size: 14px;
-            margin-right: 5px;
-        """,
-        )
+        zoom_label.setObjectName("zoom_label")
         top_bar.addWidget(zoom_label)
 
         # Enhanced zoom controls with swapped order
@@ -522,10 +808,8 @@ class ResponseWindow(ThemedWidget):
 
         for icon, tooltip, action in zoom_controls:
             btn = QPushButton()
-            from ui.ui_utils import get_icon_path
-
-            btn.setIcon(QtGui.QIcon(get_icon_path(icon, with_theme=True)))
-            btn.setStyleSheet(self.get_button_style())
+            btn.setIcon(_cached_icon(icon, current_mode))
+            btn.setObjectName("zoom_button")
             btn.setToolTip(tooltip)
             btn.clicked.connect(action)
             btn.setFixedSize(30, 30)
@@ -538,9 +822,7 @@ class ResponseWindow(ThemedWidget):
         copy_hint = QLabel(
             _("Hover over assistant responses for individual copy buttons"),
         )
-        copy_hint.setStyleSheet(
-            f"color: {'#aaaaaa' if current_mode == 'dark' else '#666666'}; font-size: 14px;",
-        )
+        copy_hint.setObjectName("copy_hint")
         copy_bar.addWidget(copy_hint)
         copy_bar.addStretch()
         content_layout.addLayout(copy_bar)
@@ -551,15 +833,7 @@ class ResponseWindow(ThemedWidget):
         loading_layout.setContentsMargins(0, 0, 0, 0)
 
         self.loading_label = QLabel(_("Thinking"))
-        self.loading_label.setStyleSheet(
-            f"""
-            QLabel {{
-                color: {'#ffffff' if current_mode == 'dark' else '#333333'};
-                font-size: 18px;
-                padding: 20px;
-            }}
-        """,
-        )
+        self.loading_label.setObjectName("thinking_label")
         self.loading_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignLeft)
 
         loading_inner_container = QWidget()
@@ -585,40 +859,16 @@ class ResponseWindow(ThemedWidget):
         # Input area with enhanced styling
         bottom_bar = QHBoxLayout()
 
-        self.input_field = QLineEdit()
+        # Parented right away so the size hint used for the send button includes the window stylesheet
+        self.input_field = QLineEdit(self.background)
         self.input_field.setPlaceholderText(_("Ask a follow-up question") + "...")
-        self.input_field.setStyleSheet(
-            f"""
-            QLineEdit {{
-                padding: 8px;
-                border: 1px solid {'#777' if current_mode == 'dark' else '#dee2e6'};
-                border-radius: 8px;
-                background-color: {'#333' if current_mode == 'dark' else '#f8f9fa'};
-                color: {'#ffffff' if current_mode == 'dark' else '#212529'};
-                font-size: 14px;
-            }}
-        """,
-        )
+        self.input_field.setObjectName("input_field")
         self.input_field.returnPressed.connect(self.send_message)
         bottom_bar.addWidget(self.input_field)
 
         send_button = QPushButton()
-        from ui.ui_utils import get_icon_path
-
-        send_button.setIcon(QtGui.QIcon(get_icon_path("send", with_theme=True)))
-        send_button.setStyleSheet(
-            f"""
-            QPushButton {{
-                background-color: {'#2e7d32' if current_mode == 'dark' else '#4CAF50'};
-                border: none;
-                border-radius: 8px;
-                padding: 5px;
-            }}
-            QPushButton:hover {{
-                background-color: {'#1b5e20' if current_mode == 'dark' else '#45a049'};
-            }}
-        """,
-        )
+        send_button.setIcon(_cached_icon("send", current_mode))
+        send_button.setObjectName("send_button")
         send_button.setFixedSize(
             self.input_field.sizeHint().height(),
             self.input_field.sizeHint().height(),
@@ -628,6 +878,15 @@ class ResponseWindow(ThemedWidget):
 
         content_layout.addLayout(bottom_bar)
 
+    @property
+    def chat_history(self) -> _ChatHistory:
+        """Conversation as role/content dicts, bounded to _MAX_CHAT_HISTORY messages"""
+        return self._chat_history
+
+    @chat_history.setter
+    def chat_history(self, messages) -> None:
+        self._chat_history = _ChatHistory(messages)
+
     # Method to get first response text
     def get_first_response_text(self):
         """Get the first model response text from chat history"""
@@ -636,8 +895,8 @@ class ResponseWindow(ThemedWidget):
             if not self.chat_history:
                 return None
 
-            # Find first assistant message
-            for msg in self.chat_history:
+            # Find first assistant message, in a snapshot as the follow-up thread may append meanwhile
+            for msg in list(self.chat_history):
                 if msg["role"] == "assistant":
                     return msg["content"]
 
@@ -652,21 +911,21 @@ class ResponseWindow(ThemedWidget):
         if response_text:
             QApplication.clipboard().setText(response_text)
 
-    def get_button_style(self):
+    def _get_stylesheet(self):
+        """Get the window stylesheet for the current effective color mode (built once per mode)"""
         current_mode = get_effective_color_mode()
-        return f"""
-            QPushButton {{
-                background-color: {'#444' if current_mode == 'dark' else '#f8f9fa'};
-                color: {'#ffffff' if current_mode == 'dark' else '#212529'};
-                border: 1px solid {'#666' if current_mode == 'dark' else '#dee2e6'};
-                border-radius: 5px;
-                padding: 8px;
-                font-size: 14px;
-            }}
-            QPushButton:hover {{
-                background-color: {'#555' if current_mode == 'dark' else '#e9ecef'};
-            }}
-        """
+        stylesheet = self._stylesheet_cache.get(current_mode)
+        if stylesheet is None:
+            stylesheet = self._stylesheet_cache[current_mode] = self._build_stylesheet(current_mode)
+        return stylesheet
+
+    @staticmethod
+    def _build_stylesheet(current_mode):
+        """Build the stylesheet covering every themed widget of the window for the given color mode"""
+        stylesheet = _WINDOW_QSS_TEMPLATE
+        for variable, value in _PALETTES['dark' if current_mode == 'dark' else 'light'].items():
+            stylesheet = stylesheet.replace(variable, value)
+        return stylesheet
 
     def update_thinking_dots(self):
         """Update the thinking animation dots with proper cycling"""
@@ -704,13 +963,33 @@ class ResponseWindow(ThemedWidget):
             self.input_field.setPlaceholderText(_("Ask a follow-up question"))
             self.input_field.setEnabled(True)
 
-        # Force layout update
-        if self.layout():
-            self.layout().invalidate()
-            self.layout().activate()
+        # Force layout update, deferred so it runs once the message being added is in place
+        QtCore.QTimer.singleShot(0, self._refresh_layout)
+
+    def _refresh_layout(self):
+        """Invalidate and immediately redo the window layout"""
+        layout = self.layout()
+        if layout:
+            layout.invalidate()
+            layout.activate()
 
     def zoom_all_messages(self, action="in"):
-        """Apply zoom action to all messages in the chat"""
+        """Queue a zoom action for all messages in the chat, applied by _flush_zoom"""
+        if action == "in":
+            self._pending_zoom += 1
+        elif action == "out":
+            self._pending_zoom -= 1
+        else:  # reset
+            self._pending_zoom = 0
+            self._pending_zoom_reset = True
+        self._zoom_flush_timer.start()
+
+    def _flush_zoom(self):
+        """Apply the zoom steps queued by zoom_all_messages to all messages in the chat"""
+        self._zoom_flush_timer.stop()
+        steps, reset = self._pending_zoom, self._pending_zoom_reset
+        self._pending_zoom = 0
+        self._pending_zoom_reset = False
         if not self.chat_area or not self.chat_area.layout:
             return
 
@@ -721,22 +1000,26 @@ class ResponseWindow(ThemedWidget):
                 if isinstance(container, MessageContainer):
                     text_display = container.text_display
                     if text_display:
-                        if action == "in":
-                            text_display.zoom_in()
-                        elif action == "out":
-                            text_display.zoom_out()
-                        else:  # reset
-                            text_display.reset_zoom()
+                        text_display.zoom_steps(steps, reset)
 
         # Update layout after zooming
         if self.chat_area:
             self.chat_area.update_content_height()
 
+    def _schedule_height_adjust(self):
+        """Adjust the window height shortly, unless an adjustment is already pending"""
+        if not self._height_adjust_timer.isActive():
+            self._height_adjust_timer.start()
+
     def _adjust_window_height(self):
         """Calculate and set the ideal window height"""
         # Skip adjustment if window already has a size
         if hasattr(self, "_size_initialized"):
             return
+        # Size to the response once its HTML is there, set_rendered_html adjusts again when it is
+        current_text_display = self.current_text_display
+        if current_text_display is not None and current_text_display.render_pending:
+            return
 
         try:
             # Get content widget height
@@ -814,53 +1097,88 @@ class ResponseWindow(ThemedWidget):
             and "response_window_zoom" in self.app.settings_manager.settings.custom_data
             and text_display
         ):
-            text_display.zoom_factor = self.app.settings_manager.settings.custom_data["response_window_zoom"]
-            text_display._apply_zoom()
+            self._set_display_zoom(
+                text_display, self.app.settings_manager.settings.custom_data["response_window_zoom"]
+            )
 
-        QtCore.QTimer.singleShot(100, self._adjust_window_height)
+        # The window is sized to fit the response, a long one is sized by set_rendered_html once rendered
+        if text_display is None or not text_display.render_pending:
+            self._schedule_height_adjust()
 
     @Slot(str)
     def handle_followup_response(self, response_text):
         """Handle the follow-up response from the AI with improved layout handling"""
-        if response_text and self.chat_area:
-            if self.loading_label:
-                self.loading_label.setVisible(False)
-            text_display = self.chat_area.add_message(response_text)
-
-            # Maintain consistent zoom level
-            if hasattr(self, "current_text_display") and self.current_text_display and text_display:
-                text_display.zoom_factor = self.current_text_display.zoom_factor
-                text_display._apply_zoom()
-
-            if len(self.chat_history) > 0 and self.chat_history[-1]["role"] != "assistant":
-                self.chat_history.append(
+        loading_label = self.loading_label
+        input_field = self.input_field
+        if response_text and self.chat_area is not None:
+            if loading_label is not None:
+                loading_label.setVisible(False)
+            if not self.isVisible() or self.isMinimized():
+                # Nobody sees it yet, skip the layout work until the window is shown again
+                self._pending_appends.append(response_text)
+            else:
+                self._add_response_message(response_text)
+
+            chat_history = self.chat_history
+            if chat_history and chat_history[-1]["role"] != "assistant":
+                chat_history.append(
                     {"role": "assistant", "content": response_text},
                 )
 
         self.stop_thinking_animation()
-        if self.input_field:
-            self.input_field.setEnabled(True)
+        if input_field is not None:
+            input_field.setEnabled(True)
+
+        # Update window height, a hidden window adjusts once its pending responses are added
+        if not self._pending_appends:
+            self._schedule_height_adjust()
+
+    def _add_response_message(self, response_text):
+        """Add an assistant message to the chat area, at the current zoom level like every new message"""
+        self.chat_area.add_message(response_text)
+
+    @staticmethod
+    def _set_display_zoom(text_display, zoom_factor):
+        """Give a message the zoom factor, leaving it alone if it already has it"""
+        if text_display.zoom_factor != zoom_factor:
+            text_display.zoom_factor = zoom_factor
+            text_display._apply_zoom()
+
+    def _flush_pending_appends(self):
+        """Add the responses received while the window was hidden"""
+        if not self._pending_appends or not self.chat_area:
+            return
+
+        pending, self._pending_appends = self._pending_appends, []
+        for response_text in pending:
+            self._add_response_message(response_text)
+        self._schedule_height_adjust()
 
-        # Update window height
-        QtCore.QTimer.singleShot(100, self._adjust_window_height)
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._flush_pending_appends()
+
+    def changeEvent(self, event):
+        super().changeEvent(event)
+        if event.type() == QtCore.QEvent.Type.WindowStateChange and not self.isMinimized():
+            self._flush_pending_appends()
 
     def send_message(self):
         """Send a new message/question"""
-        if not self.input_field or not self.chat_area:
+        input_field = self.input_field
+        chat_area = self.chat_area
+        if input_field is None or chat_area is None:
             return
 
-        message = self.input_field.text().strip()
+        message = input_field.text().strip()
         if not message:
             return
 
-        self.input_field.setEnabled(False)
-        self.input_field.clear()
+        input_field.setEnabled(False)
+        input_field.clear()
 
-        # Add user message and maintain zoom level
-        text_display = self.chat_area.add_message(message, is_user=True)
-        if hasattr(self, "current_text_display") and self.current_text_display and text_display:
-            text_display.zoom_factor = self.current_text_display.zoom_factor
-            text_display._apply_zoom()
+        # Add user message, it starts at the current zoom level
+        chat_area.add_message(message, is_user=True)
 
         self.chat_history.append({"role": "user", "content": message})
         self.start_thinking_animation()
@@ -868,23 +1186,33 @@ class ResponseWindow(ThemedWidget):
 
     def copy_as_markdown(self):
         """Copy conversation as Markdown"""
-        markdown = ""
-        for msg in self.chat_history:
-            if msg["role"] == "user":
-                markdown += f"**User**: {msg['content']}\n\n"
-            else:
-                markdown += f"**Assistant**: {msg['content']}\n\n"
-
-        QApplication.clipboard().setText(markdown)
+        parts = []
+        # Snapshot, the follow-up thread may append meanwhile
+        for msg in list(self.chat_history):
+            parts += (_USER_PREFIX if msg["role"] == "user" else _ASSISTANT_PREFIX, msg["content"], "\n\n")
+
+        # Offer the Markdown flavour too so editors that understand it can paste it as such
+        markdown = "".join(parts)
+        mime_data = QMimeData()
+        mime_data.setText(markdown)
+        mime_data.setData("text/markdown", markdown.encode("utf-8"))
+        QApplication.clipboard().setMimeData(mime_data)
 
     def closeEvent(self, event):
         """Handle window close event"""
+        # Apply a zoom still waiting for its flush so the saved factor is the last one asked for
+        if self._zoom_flush_timer.isActive():
+            self._flush_zoom()
+
         # Save zoom factor to settings
-        if hasattr(self, "current_text_display") and self.current_text_display:
-            if not self.app.settings_manager.settings.custom_data:
-                self.app.settings_manager.settings.custom_data = {}
-            self.app.settings_manager.response_window_zoom = self.current_text_display.zoom_factor
-            self.app.save_settings()
+        current_display = self.current_text_display
+        if current_display is not None:
+            settings_manager = self.app.settings_manager
+            if not settings_manager.settings.custom_data:
+                settings_manager.settings.custom_data = {}
+            # Stored in custom_data, where set_text reads it back for the next window
+            settings_manager.settings.custom_data["response_window_zoom"] = current_display.zoom_factor
+            self.app.schedule_settings_save()
 
         self.chat_history = []
 
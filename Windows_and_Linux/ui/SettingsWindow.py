@@ -8,25 +8,232 @@ L285   No sure about that:      # Add save button (especially important for prov
 """
 
 import logging
-import os
 import sys
 from typing import TYPE_CHECKING
 
 from PySide6 import QtCore, QtWidgets, QtGui
-from PySide6.QtGui import QImage
 from PySide6.QtWidgets import QHBoxLayout, QRadioButton, QScrollArea, QWidget
 
 if TYPE_CHECKING:
-    from aiprovider import AIProvider
     from Windows_and_Linux.WritingToolApp import WritingToolApp
+from aiprovider import AIProvider
 from config.constants import PROVIDER_DISPLAY_NAMES
-from config.data_operations import get_provider_display_name, get_provider_internal_name
 from ui.AutostartManager import AutostartManager
-from ui.ui_utils import ThemedWidget, ui_utils, get_icon_path
+from ui.ui_utils import ThemedWidget, ui_utils, get_effective_color_mode, get_icon_path
 from ui.ThemeManager import ThemeAwareMixin, theme_manager
 
 _ = lambda x: x
 
+# Window stylesheet, with @variables substituted from the color mode palette.
+# Widgets are matched by object name; provider buttons also by their "secondary" property.
+_WINDOW_QSS_TEMPLATE = """
+    QScrollArea#scroll_area {
+        background: transparent;
+        border: none;
+    }
+    QScrollArea#scroll_area > QWidget > QWidget {
+        background: transparent;
+    }
+    QScrollArea#scroll_area QScrollBar:vertical {
+        background-color: rgba(0, 0, 0, 0.1);
+        width: 12px;
+        margin: 0px;
+        border-radius: 6px;
+    }
+    QScrollArea#scroll_area QScrollBar::handle:vertical {
+        background-color: rgba(128, 128, 128, 0.6);
+        min-height: 20px;
+        border-radius: 6px;
+        margin: 2px;
+    }
+    QScrollArea#scroll_area QScrollBar::handle:vertical:hover {
+        background-color: rgba(128, 128, 128, 0.8);
+    }
+    QScrollArea#scroll_area QScrollBar::handle:vertical:pressed {
+        background-color: rgba(128, 128, 128, 1.0);
+    }
+    QScrollArea#scroll_area QScrollBar::add-line:vertical, QScrollArea#scroll_area QScrollBar::sub-line:vertical {
+        height: 0px;
+    }
+    QScrollArea#scroll_area QScrollBar:horizontal {
+        background-color: rgba(0, 0, 0, 0.1);
+        height: 12px;
+        margin: 0px;
+        border-radius: 6px;
+    }
+    QScrollArea#scroll_area QScrollBar::handle:horizontal {
+        background-color: rgba(128, 128, 128, 0.6);
+        min-width: 20px;
+        border-radius: 6px;
+        margin: 2px;
+    }
+    QScrollArea#scroll_area QScrollBar::handle:horizontal:hover {
+        background-color: rgba(128, 128, 128, 0.8);
+    }
+    QScrollArea#scroll_area QScrollBar::handle:horizontal:pressed {
+        background-color: rgba(128, 128, 128, 1.0);
+    }
+    QScrollArea#scroll_area QScrollBar::add-line:horizontal, QScrollArea#scroll_area QScrollBar::sub-line:horizontal {
+        width: 0px;
+        background: transparent;
+    }
+    QScrollArea#scroll_area QScrollBar::add-page:vertical, QScrollArea#scroll_area QScrollBar::sub-page:vertical {
+        background: transparent;
+    }
+    QWidget#scroll_content, QWidget#scroll_content * {
+        background: transparent;
+    }
+    QLabel#title_label {
+        font-size: 16px;
+        font-weight: bold;
+        color: @text;
+    }
+    QLabel#section_label, QLabel#setting_label {
+        font-size: 16px;
+        color: @text;
+    }
+    QLabel#provider_name_label {
+        font-size: 18px;
+        font-weight: bold;
+        color: @provider_name;
+    }
+    QRadioButton#theme_radio {
+        color: @text;
+        font-size: 16px;
+    }
+    QCheckBox#autostart_checkbox {
+        color: @text;
+        font-size: 16px;
+    }
+    QLineEdit#shortcut_input, QLineEdit#setting_input {
+        font-size: 16px;
+        padding: 5px;
+        background-color: @input_bg;
+        color: @input_text;
+        border: 1px solid @input_border;
+    }
+    QComboBox#color_mode_dropdown, QComboBox#provider_dropdown {
+        background-color: @input_bg;
+        color: @input_text;
+        border: 1px solid @input_border;
+        padding: 5px;
+        font-size: 16px;
+    }
+    QComboBox#color_mode_dropdown QAbstractItemView, QComboBox#provider_dropdown QAbstractItemView {
+        background-color: @input_bg;
+        color: @input_text;
+        selection-background-color: @selection_bg;
+    }
+    QComboBox#setting_dropdown, QComboBox#setting_dropdown * {
+        font-size: 16px;
+        padding: 5px;
+        padding-right: 25px;
+        background-color: @input_bg;
+        color: @input_text;
+        border: 1px solid @input_border;
+    }
+    QPushButton#provider_button {
+        background-color: @action_bg;
+        color: white;
+        padding: 10px;
+        font-size: 16px;
+        border: none;
+        border-radius: 5px;
+    }
+    QPushButton#provider_button:hover {
+        background-color: @action_hover;
+    }
+    QPushButton#provider_extra_button {
+        background-color: @action_bg;
+        color: white;
+        padding: 8px 12px;
+        font-size: 14px;
+        border: none;
+        border-radius: 4px;
+    }
+    QPushButton#provider_extra_button:hover {
+        background-color: @action_hover;
+    }
+    QPushButton#provider_extra_button[secondary="true"] {
+        background-color: @secondary_bg;
+        color: @secondary_text;
+    }
+    QPushButton#provider_extra_button[secondary="true"]:hover {
+        background-color: @secondary_hover;
+    }
+    QPushButton#save_button {
+        background-color: @save_bg;
+        color: white;
+        border: none;
+        border-radius: 6px;
+        font-size: 14px;
+        font-weight: bold;
+        padding: 8px 16px;
+    }
+    QPushButton#save_button:hover {
+        background-color: @save_hover;
+    }
+    QPushButton#save_button:pressed {
+        background-color: @save_pressed;
+    }
+"""
+
+# Light mode only: the default check box indicator is hard to see on the light background
+_LIGHT_CHECKBOX_QSS = """
+    QCheckBox#autostart_checkbox {
+        spacing: 8px;
+    }
+    QCheckBox#autostart_checkbox::indicator {
+        width: 13px;
+        height: 13px;
+        border-radius: 2px;
+    }
+    QCheckBox#autostart_checkbox::indicator:unchecked {
+        border: 2px solid #666666;
+        background-color: white;
+    }
+    QCheckBox#autostart_checkbox::indicator:checked {
+        border: 2px solid #666666;
+        background-color: #666666;
+        image: url(data:image/svg+xml;base64,PHN2ZyB3aWR0aD0iOSIgaGVpZ2h0PSI5IiB2aWV3Qm94PSIwIDAgOSA5IiBmaWxsPSJub25lIiB4bWxucz0iaHR0cDovL3d3dy53My5vcmcvMjAwMC9zdmciPgo8cGF0aCBkPSJNNy41IDIuNUwzLjc1IDYuMjVMMi41IDUiIHN0cm9rZT0id2hpdGUiIHN0cm9rZS13aWR0aD0iMS4yIiBzdHJva2UtbGluZWNhcD0icm91bmQiIHN0cm9rZS1saW5lam9pbj0icm91bmQiLz4KPC9zdmc+Cg==);
+    }
+"""
+
+_PALETTES = {
+    'dark': {
+        '@text': '#ffffff',
+        '@provider_name': '#ffffff',
+        '@input_bg': '#444',
+        '@input_text': '#ffffff',
+        '@input_border': '#666',
+        '@selection_bg': '#666',
+        '@action_bg': '#4CAF50',
+        '@action_hover': '#45a049',
+        '@secondary_bg': '#666666',
+        '@secondary_text': '#ffffff',
+        '@secondary_hover': '#555555',
+        '@save_bg': '#106ebe',
+        '@save_hover': '#1e88e5',
+        '@save_pressed': '#0d47a1',
+    },
+    'light': {
+        '@text': '#333333',
+        '@provider_name': '#000000',
+        '@input_bg': 'white',
+        '@input_text': '#000000',
+        '@input_border': '#ccc',
+        '@selection_bg': '#e0e0e0',
+        '@action_bg': '#008CBA',
+        '@action_hover': '#007095',
+        '@secondary_bg': '#cccccc',
+        '@secondary_text': '#333333',
+        '@secondary_hover': '#bbbbbb',
+        '@save_bg': '#0078d4',
+        '@save_hover': '#106ebe',
+        '@save_pressed': '#005a9e',
+    },
+}
+
 
 class SettingsWindow(ThemeAwareMixin, ThemedWidget):
     """
@@ -36,10 +243,12 @@ class SettingsWindow(ThemeAwareMixin, ThemedWidget):
 
     close_signal = QtCore.Signal()
 
+    # Window stylesheet per color mode, shared by all instances
+    _stylesheet_cache: dict[str, str] = {}
+
     def __init__(self, app: 'WritingToolApp', providers_only=False):
         super().__init__()
         self.app = app
-        self.current_provider_layout = None
         # Special mode to show only provider settings (during first setup)
         self.providers_only = providers_only
         self.gradient_radio = None
@@ -47,11 +256,31 @@ class SettingsWindow(ThemeAwareMixin, ThemedWidget):
         self.color_mode_dropdown = None
         self.provider_dropdown = None
         self.provider_container = None
+        # Provider settings pages by internal name, built the first time their provider is shown
+        self._provider_pages: dict[str, QWidget] = {}
+        self._current_provider_page = None
         self.autostart_checkbox = None
         self.shortcut_input = None
+        # Color mode of the installed window stylesheet
+        self._stylesheet_mode = None
         # Reference to previous window to return to after closing
         self.previous_window = None
 
+        # Applies the shortcut once typing pauses instead of registering it on every keystroke
+        self._shortcut_save_timer = QtCore.QTimer(self)
+        self._shortcut_save_timer.setSingleShot(True)
+        self._shortcut_save_timer.setInterval(400)
+        self._shortcut_save_timer.timeout.connect(self._save_shortcut)
+
+        # Providers whose config changed, and the last selected provider, saved once changes pause
+        # instead of on every keystroke or dropdown step
+        self._pending_provider_saves: set[str] = set()
+        self._pending_selected_provider = None
+        self._provider_save_timer = QtCore.QTimer(self)
+        self._provider_save_timer.setSingleShot(True)
+        self._provider_save_timer.setInterval(150)
+        self._provider_save_timer.timeout.connect(self._save_pending_providers)
+
         # Store current theme as instance variable for use throughout the class
         self.current_theme = self.app.settings_manager.theme or "gradient"
 
@@ -66,9 +295,8 @@ class SettingsWindow(ThemeAwareMixin, ThemedWidget):
         """Get the effective color mode based on user settings."""
         user_mode = self.app.settings_manager.color_mode or "auto"
         if user_mode == "auto":
-            import darkdetect
-
-            return "dark" if darkdetect.isDark() else "light"
+            # Resolved by set_color_mode when the mode was applied, so the OS isn't queried again
+            return get_effective_color_mode()
         return user_mode
 
     def init_ui(self):
@@ -76,6 +304,7 @@ class SettingsWindow(ThemeAwareMixin, ThemedWidget):
         Initialize the user interface for the settings window.
         Now includes a scroll area for better handling of content on smaller screens.
         """
+        settings_manager = self.app.settings_manager
         self.setWindowTitle(_("Settings"))
         # Fixed width to maintain consistent layout and provide space for dropdowns
         self.setMinimumWidth(700)
@@ -93,6 +322,8 @@ class SettingsWindow(ThemeAwareMixin, ThemedWidget):
         self.raise_()
         self.activateWindow()
 
+        self._apply_stylesheet()
+
         main_layout = QtWidgets.QVBoxLayout(self.background)  # Set icon, margin, and spacing in ThemedWidget
 
         # Earlier scroll_area and scroll_content creation moved up
@@ -107,68 +338,12 @@ class SettingsWindow(ThemeAwareMixin, ThemedWidget):
             QtCore.Qt.ScrollBarPolicy.ScrollBarAsNeeded,
         )
 
-        # Custom styling for transparent and aesthetic scroll bars
-        scroll_area.setStyleSheet(
-            """
-            QScrollArea {
-                background: transparent;
-                border: none;
-            }
-            QScrollArea > QWidget > QWidget {
-                background: transparent;
-            }
-            QScrollBar:vertical {
-                background-color: rgba(0, 0, 0, 0.1);
-                width: 12px;
-                margin: 0px;
-                border-radius: 6px;
-            }
-            QScrollBar::handle:vertical {
-                background-color: rgba(128, 128, 128, 0.6);
-                min-height: 20px;
-                border-radius: 6px;
-                margin: 2px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background-color: rgba(128, 128, 128, 0.8);
-            }
-            QScrollBar::handle:vertical:pressed {
-                background-color: rgba(128, 128, 128, 1.0);
-            }
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                height: 0px;
-            }
-            QScrollBar:horizontal {
-                background-color: rgba(0, 0, 0, 0.1);
-                height: 12px;
-                margin: 0px;
-                border-radius: 6px;
-            }
-            QScrollBar::handle:horizontal {
-                background-color: rgba(128, 128, 128, 0.6);
-                min-width: 20px;
-                border-radius: 6px;
-                margin: 2px;
-            }
-            QScrollBar::handle:horizontal:hover {
-                background-color: rgba(128, 128, 128, 0.8);
-            }
-            QScrollBar::handle:horizontal:pressed {
-                background-color: rgba(128, 128, 128, 1.0);
-            }
-            QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {
-                width: 0px;
-                background: transparent;
-            }
-            QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {
-                background: transparent;
-            }
-        """,
-        )
+        # Transparent and aesthetic scroll bars come from the window stylesheet
+        scroll_area.setObjectName("scroll_area")
 
         # Create scrollable content widget with transparent background
         scroll_content = QWidget()
-        scroll_content.setStyleSheet("background: transparent;")
+        scroll_content.setObjectName("scroll_content")
         content_layout = QtWidgets.QVBoxLayout(scroll_content)
         content_layout.setContentsMargins(30, 30, 30, 30)
         content_layout.setSpacing(20)
@@ -176,8 +351,7 @@ class SettingsWindow(ThemeAwareMixin, ThemedWidget):
         # Full settings window (not provider-only mode)
         if not self.providers_only:
             title_label = QtWidgets.QLabel(_("Settings"))
-            title_label.setObjectName("title_label")  # For specific styling in refresh
-            title_label.setStyleSheet(f"font-size: 24px; font-weight: bold; {self.get_label_style()}")
+            title_label.setObjectName("title_label")
             content_layout.addWidget(
                 title_label,
                 alignment=QtCore.Qt.AlignmentFlag.AlignCenter,
@@ -186,37 +360,37 @@ class SettingsWindow(ThemeAwareMixin, ThemedWidget):
             # Autostart functionality only for Windows compiled version
             if AutostartManager.get_startup_path():
                 self.autostart_checkbox = QtWidgets.QCheckBox(_("Start on Boot"))
-                self.autostart_checkbox.setStyleSheet(self.get_checkbox_style())
+                self.autostart_checkbox.setObjectName("autostart_checkbox")
 
                 # Synchronize settings with registry state on startup
-                AutostartManager.sync_with_settings(self.app.settings_manager)
+                AutostartManager.sync_with_settings(settings_manager)
 
                 # Set checkbox state from settings (now synchronized)
-                self.autostart_checkbox.setChecked(getattr(self.app.settings_manager, 'start_on_boot', False))
+                self.autostart_checkbox.setChecked(getattr(settings_manager, 'start_on_boot', False))
                 self.autostart_checkbox.stateChanged.connect(self.toggle_autostart)
                 content_layout.addWidget(self.autostart_checkbox)
 
             # Global hotkey configuration
             shortcut_label = QtWidgets.QLabel(_("Shortcut Key:"))
-            shortcut_label.setStyleSheet(self.get_label_style())
+            shortcut_label.setObjectName("section_label")
             content_layout.addWidget(shortcut_label)
 
-            self.shortcut_input = QtWidgets.QLineEdit(self.app.settings_manager.hotkey or 'ctrl+space')
-            self.shortcut_input.setStyleSheet(self.get_input_style())
+            self.shortcut_input = QtWidgets.QLineEdit(settings_manager.hotkey or 'ctrl+space')
+            self.shortcut_input.setObjectName("shortcut_input")
             # Auto-save when shortcut changes
             self.shortcut_input.textChanged.connect(self.auto_save_shortcut)
             content_layout.addWidget(self.shortcut_input)
 
             # Background theme selection
             theme_label = QtWidgets.QLabel(_("Background Theme:"))
-            theme_label.setStyleSheet(self.get_label_style())
+            theme_label.setObjectName("section_label")
             content_layout.addWidget(theme_label)
 
             theme_layout = QHBoxLayout()
             self.gradient_radio = QRadioButton(_("Blurry Gradient"))
             self.plain_radio = QRadioButton(_("Plain"))
-            self.gradient_radio.setStyleSheet(self.get_radio_style())
-            self.plain_radio.setStyleSheet(self.get_radio_style())
+            self.gradient_radio.setObjectName("theme_radio")
+            self.plain_radio.setObjectName("theme_radio")
             # Use the instance variable instead of re-reading from settings
             self.gradient_radio.setChecked(self.current_theme == "gradient")
             self.plain_radio.setChecked(self.current_theme == "plain")
@@ -229,41 +403,44 @@ class SettingsWindow(ThemeAwareMixin, ThemedWidget):
 
             # Color mode selection
             color_mode_label = QtWidgets.QLabel(_("Color Mode:"))
-            color_mode_label.setStyleSheet(self.get_label_style())
+            color_mode_label.setObjectName("section_label")
             content_layout.addWidget(color_mode_label)
 
             self.color_mode_dropdown = QtWidgets.QComboBox()
-            self.color_mode_dropdown.addItems([_("Auto"), _("Light"), _("Dark")])
+            # Translated names as display text, internal color modes as data
+            self.color_mode_dropdown.addItem(_("Auto"), "auto")
+            self.color_mode_dropdown.addItem(_("Light"), "light")
+            self.color_mode_dropdown.addItem(_("Dark"), "dark")
 
             # Set current selection based on saved setting
-            current_mode = self.app.settings_manager.color_mode or "auto"
-            mode_index = {"auto": 0, "light": 1, "dark": 2}.get(current_mode, 0)
-            self.color_mode_dropdown.setCurrentIndex(mode_index)
+            current_mode = settings_manager.color_mode or "auto"
+            mode_index = self.color_mode_dropdown.findData(current_mode)
+            self.color_mode_dropdown.setCurrentIndex(max(mode_index, 0))
 
-            self.color_mode_dropdown.setStyleSheet(self.get_dropdown_style())
+            self.color_mode_dropdown.setObjectName("color_mode_dropdown")
 
             # Auto-save color mode changes for immediate visual feedback
-            self.color_mode_dropdown.currentTextChanged.connect(self.auto_save_color_mode)
+            self.color_mode_dropdown.currentIndexChanged.connect(self.auto_save_color_mode)
 
             # Prevent wheel scroll from interfering with main scroll area
-            self.color_mode_dropdown.wheelEvent = lambda e: e.ignore()
+            self.color_mode_dropdown.installEventFilter(self)
 
             content_layout.addWidget(self.color_mode_dropdown)
 
         # AI Provider selection section
         provider_label = QtWidgets.QLabel(_("Choose AI Provider:"))
-        provider_label.setStyleSheet(self.get_label_style())
+        provider_label.setObjectName("section_label")
         content_layout.addWidget(provider_label)
 
         self.provider_dropdown = QtWidgets.QComboBox()
-        self.provider_dropdown.setStyleSheet(self.get_dropdown_style())
+        self.provider_dropdown.setObjectName("provider_dropdown")
         self.provider_dropdown.setInsertPolicy(
             QtWidgets.QComboBox.InsertPolicy.NoInsert,
         )
         # Prevent wheel scroll from interfering with main scroll area
-        self.provider_dropdown.wheelEvent = lambda e: e.ignore()
+        self.provider_dropdown.installEventFilter(self)
 
-        current_provider = self.app.settings_manager.provider
+        current_provider = settings_manager.provider
 
         # Populate dropdown with display names while storing internal names as data
         # This separation allows for localized display names while maintaining stable internal identifiers
@@ -271,8 +448,7 @@ class SettingsWindow(ThemeAwareMixin, ThemedWidget):
             self.provider_dropdown.addItem(display_name, internal_name)
 
         # Set current selection based on internal name
-        current_display_name = get_provider_display_name(current_provider)
-        current_index = self.provider_dropdown.findText(current_display_name)
+        current_index = self.provider_dropdown.findData(current_provider)
         if current_index != -1:
             self.provider_dropdown.setCurrentIndex(current_index)
         else:
@@ -285,19 +461,16 @@ class SettingsWindow(ThemeAwareMixin, ThemedWidget):
         line.setFrameShadow(QtWidgets.QFrame.Shadow.Sunken)
         content_layout.addWidget(line)
 
-        # Create container for provider UI
+        # Create container for provider UI, holding one page per provider
         self.provider_container = QtWidgets.QVBoxLayout()
         content_layout.addLayout(self.provider_container)
 
         # Initialize provider UI
         current_internal_name = self.provider_dropdown.currentData()
-        provider_instance = next(
-            (provider for provider in self.app.providers if provider.internal_name == current_internal_name),
-            self.app.providers[0],
-        )
-        self.init_provider_ui(provider_instance, self.provider_container)
+        provider_instance = self.app.providers_by_name.get(current_internal_name, self.app.providers[0])
+        self.show_provider_page(provider_instance)
 
-        # React to provider changes by rebuilding the UI and auto-saving
+        # React to provider changes by switching the page and auto-saving
         self.provider_dropdown.currentIndexChanged.connect(self._on_provider_changed)
         self.provider_dropdown.currentIndexChanged.connect(self.auto_save_provider)
 
@@ -343,24 +516,6 @@ class SettingsWindow(ThemeAwareMixin, ThemedWidget):
         # Refresh provider configuration before building UI (for dynamic providers like Ollama)
         if hasattr(provider, 'refresh_configuration'):
             provider.refresh_configuration()
-        # Clean up previous provider UI to prevent memory leaks and layout conflicts
-        if self.current_provider_layout:
-            # Remove the old layout from its parent container first
-            parent = self.current_provider_layout.parent()
-            if parent and hasattr(parent, 'removeItem'):
-                # Cast to layout type to access removeItem method
-                from PySide6.QtWidgets import QLayout
-
-                if isinstance(parent, QLayout):
-                    parent.removeItem(self.current_provider_layout)
-            self.current_provider_layout.setParent(None)
-            ui_utils.clear_layout(self.current_provider_layout)
-            self.current_provider_layout.deleteLater()
-
-        # Also clear the container layout to ensure no old widgets remain
-        ui_utils.clear_layout(layout)
-
-        self.current_provider_layout = QtWidgets.QVBoxLayout()
 
         # Provider header with logo and name
         provider_header_layout = QtWidgets.QHBoxLayout()
@@ -371,12 +526,8 @@ class SettingsWindow(ThemeAwareMixin, ThemedWidget):
         if provider.logo:
             # Use get_icon_path for proper path resolution in all modes (dev, build, etc.)
             logo_path = get_icon_path(f"provider_{provider.logo}", with_theme=False)
-            if logo_path and os.path.exists(logo_path):
-                targetPixmap = ui_utils.resize_and_round_image(
-                    QImage(logo_path),
-                    30,
-                    15,
-                )
+            if logo_path:
+                targetPixmap = ui_utils.load_rounded_image(logo_path, 30, 15)
                 logo_label = QtWidgets.QLabel()
                 logo_label.setPixmap(targetPixmap)
                 logo_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignVCenter)
@@ -386,22 +537,19 @@ class SettingsWindow(ThemeAwareMixin, ThemedWidget):
 
         # Provider name display
         provider_name_label = QtWidgets.QLabel(provider.provider_name)
-        # Provider title needs high contrast - force pure white/black
-        # Use effective mode based on user settings
-        current_mode = self._get_effective_mode()
-        provider_color = '#ffffff' if current_mode == 'dark' else '#000000'
-        provider_name_label.setStyleSheet(f"font-size: 18px; font-weight: bold; color: {provider_color};")
+        # Provider title needs high contrast - pure white/black from the window stylesheet
+        provider_name_label.setObjectName("provider_name_label")
         provider_name_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignVCenter)
         provider_header_layout.addWidget(provider_name_label)
 
-        self.current_provider_layout.addLayout(provider_header_layout)
+        layout.addLayout(provider_header_layout)
 
         # Provider description if available
         if provider.description:
             description_label = QtWidgets.QLabel(provider.description)
-            description_label.setStyleSheet(f"{self.get_label_style()} text-align: center;")
+            description_label.setObjectName("section_label")
             description_label.setWordWrap(True)
-            self.current_provider_layout.addWidget(description_label)
+            layout.addWidget(description_label)
 
         # Button container for multiple buttons
         if provider.button_text or (hasattr(provider, 'additional_buttons') and provider.additional_buttons):
@@ -411,22 +559,7 @@ class SettingsWindow(ThemeAwareMixin, ThemedWidget):
             # Main button
             if provider.button_text:
                 main_button = QtWidgets.QPushButton(provider.button_text)
-                current_mode = self._get_effective_mode()
-                main_button.setStyleSheet(
-                    f"""
-                        QPushButton {{
-                            background-color: {'#4CAF50' if current_mode == 'dark' else '#008CBA'};
-                            color: white;
-                            padding: 10px;
-                            font-size: 16px;
-                            border: none;
-                            border-radius: 5px;
-                        }}
-                        QPushButton:hover {{
-                            background-color: {'#45a049' if current_mode == 'dark' else '#007095'};
-                        }}
-                    """,
-                )
+                main_button.setObjectName("provider_button")
                 main_button.clicked.connect(provider.button_action)
                 button_container.addWidget(main_button)
 
@@ -434,82 +567,79 @@ class SettingsWindow(ThemeAwareMixin, ThemedWidget):
             if hasattr(provider, 'additional_buttons'):
                 for button_config in provider.additional_buttons:
                     additional_button = QtWidgets.QPushButton(button_config["text"])
-                    current_mode = self._get_effective_mode()
-
+                    additional_button.setObjectName("provider_extra_button")
                     # Different style for secondary buttons
-                    if button_config.get("style") == "secondary":
-                        bg_color = '#666666' if current_mode == 'dark' else '#cccccc'
-                        hover_color = '#555555' if current_mode == 'dark' else '#bbbbbb'
-                        text_color = '#ffffff' if current_mode == 'dark' else '#333333'
-                    else:
-                        bg_color = '#4CAF50' if current_mode == 'dark' else '#008CBA'
-                        hover_color = '#45a049' if current_mode == 'dark' else '#007095'
-                        text_color = 'white'
-
-                    additional_button.setStyleSheet(
-                        f"""
-                            QPushButton {{
-                                background-color: {bg_color};
-                                color: {text_color};
-                                padding: 8px 12px;
-                                font-size: 14px;
-                                border: none;
-                                border-radius: 4px;
-                            }}
-                            QPushButton:hover {{
-                                background-color: {hover_color};
-                            }}
-                        """,
-                    )
+                    additional_button.setProperty("secondary", button_config.get("style") == "secondary")
                     additional_button.clicked.connect(button_config["action"])
                     button_container.addWidget(additional_button)
 
             # Center the button container
             button_widget = QtWidgets.QWidget()
             button_widget.setLayout(button_container)
-            self.current_provider_layout.addWidget(
+            layout.addWidget(
                 button_widget,
                 alignment=QtCore.Qt.AlignmentFlag.AlignCenter,
             )
 
-        # Initialize provider config if needed
-        if not self.app.settings_manager.providers:
-            self.app.settings_manager.providers = {}
-
-        if provider.internal_name not in self.app.settings_manager.providers:
-            self.app.settings_manager.providers[provider.internal_name] = {}
+        # Initialize provider config if needed (the providers property always returns a dict)
+        provider_config = self.app.settings_manager.providers.setdefault(provider.internal_name, {})
 
         # Build provider-specific settings UI dynamically
-        provider_config = self.app.settings_manager.providers[provider.internal_name]
         for setting in provider.settings:
             # Load saved value or use default
             saved_value = provider_config.get(setting.name, setting.default_value)
             setting.set_value(saved_value)
             # Set auto-save callback for immediate saving
-            setting.set_auto_save_callback(lambda: self.save_provider_settings())
+            setting.set_auto_save_callback(lambda: self.save_provider_settings(provider.internal_name))
             # Each setting knows how to render itself to the layout
-            setting.render_to_layout(self.current_provider_layout)
-
-        layout.addLayout(self.current_provider_layout)
+            setting.render_to_layout(layout)
 
-        # Prevent dropdown controls from interfering with main scroll area
-        self.disable_dropdown_scroll(self.current_provider_layout)
-
-    def disable_dropdown_scroll(self, layout):
+    def show_provider_page(self, provider: 'AIProvider'):
+        """
+        Show the settings page of the provider, building it on first use.
+        Pages are kept, so switching back to a provider doesn't rebuild its widgets,
+        except for providers refreshing their configuration, which get a fresh page.
         """
-        Recursively disable wheel events on all QComboBox widgets in the layout
-        to prevent them from interfering with the main scroll area.
-        This ensures smooth scrolling experience when hovering over dropdowns.
+        page = self._provider_pages.get(provider.internal_name)
+        if page is not None and type(provider).refresh_configuration is not AIProvider.refresh_configuration:
+            # The provider reconfigures itself (e.g. Ollama's model list and installation state),
+            # so its page is built again on every visit; unsaved edits are saved first to be reloaded
+            if provider.internal_name in self._pending_provider_saves:
+                self._save_pending_providers()
+            if self._current_provider_page is page:
+                self._current_provider_page = None
+            page.hide()
+            self.provider_container.removeWidget(page)
+            page.deleteLater()
+            page = None
+        if page is None:
+            page = QWidget()
+            page_layout = QtWidgets.QVBoxLayout(page)
+            page_layout.setContentsMargins(0, 0, 0, 0)
+            page_layout.setSpacing(20)  # Same spacing as the content layout the page sits in
+            self.init_provider_ui(provider, page_layout)
+            # Prevent dropdown controls from interfering with main scroll area
+            for combo in page.findChildren(QtWidgets.QComboBox):
+                combo.installEventFilter(self)
+            self._provider_pages[provider.internal_name] = page
+            self.provider_container.addWidget(page)
+
+        # Hidden pages take no room in the layout (unlike in a QStackedWidget, which is as
+        # tall as its tallest page), so the content keeps the height of the shown page
+        if self._current_provider_page is not None and self._current_provider_page is not page:
+            self._current_provider_page.hide()
+        self._current_provider_page = page
+        page.show()
+
+    def eventFilter(self, obj, event):
         """
-        for i in range(layout.count()):
-            item = layout.itemAt(i)
-            if item.widget():
-                widget = item.widget()
-                if isinstance(widget, QtWidgets.QComboBox):
-                    widget.wheelEvent = lambda e: e.ignore()
-            elif item.layout():
-                # Recursively check nested layouts
-                self.disable_dropdown_scroll(item.layout())
+        Keep dropdowns from changing value on wheel scroll.
+        The event is ignored so it propagates to the main scroll area, which scrolls instead.
+        """
+        if event.type() == QtCore.QEvent.Type.Wheel and isinstance(obj, QtWidgets.QComboBox):
+            event.ignore()
+            return True
+        return super().eventFilter(obj, event)
 
     def showEvent(self, event):
         """Handle window show event to ensure focus."""
@@ -545,10 +675,9 @@ class SettingsWindow(ThemeAwareMixin, ThemedWidget):
         if focused_widget and isinstance(focused_widget, QtWidgets.QComboBox):
             return
 
-        # Check for any open dropdown popups in the entire application
-        for widget in QtWidgets.QApplication.allWidgets():
-            if isinstance(widget, QtWidgets.QComboBox) and widget.view().isVisible():
-                return
+        # Don't steal focus from an open popup (e.g. a dropdown list) anywhere in the application
+        if QtWidgets.QApplication.activePopupWidget() is not None:
+            return
 
         # Only regain focus if we genuinely lost it to something external
         if not self.hasFocus() and not self.isAncestorOf(
@@ -577,28 +706,8 @@ class SettingsWindow(ThemeAwareMixin, ThemedWidget):
             button_text = _("Close Settings")
 
         self.save_button = QtWidgets.QPushButton(button_text)
+        self.save_button.setObjectName("save_button")
         self.save_button.setFixedSize(150, 40)
-        # Use effective mode based on user settings
-        current_mode = self._get_effective_mode()
-        self.save_button.setStyleSheet(
-            f"""
-            QPushButton {{
-                background-color: {'#0078d4' if current_mode == 'light' else '#106ebe'};
-                color: white;
-                border: none;
-                border-radius: 6px;
-                font-size: 14px;
-                font-weight: bold;
-                padding: 8px 16px;
-            }}
-            QPushButton:hover {{
-                background-color: {'#106ebe' if current_mode == 'light' else '#1e88e5'};
-            }}
-            QPushButton:pressed {{
-                background-color: {'#005a9e' if current_mode == 'light' else '#0d47a1'};
-            }}
-        """,
-        )
 
         # Connect button to save function
         self.save_button.clicked.connect(self.save_settings)
@@ -612,8 +721,13 @@ class SettingsWindow(ThemeAwareMixin, ThemedWidget):
     def auto_save_shortcut(self):
         """
         Auto-save shortcut when it changes to provide immediate feedback.
-        Automatically registers the new hotkey with the system.
+        The new hotkey is registered with the system once typing pauses.
         """
+        self._shortcut_save_timer.start()
+
+    def _save_shortcut(self):
+        """Save the typed shortcut and register it as the new hotkey."""
+        self._shortcut_save_timer.stop()
         if hasattr(self, "shortcut_input") and self.shortcut_input is not None and not self.providers_only:
             self.app.settings_manager.hotkey = self.shortcut_input.text() or "ctrl+space"
             self.app.register_hotkey()
@@ -636,10 +750,7 @@ class SettingsWindow(ThemeAwareMixin, ThemedWidget):
         Auto-save color mode when it changes for immediate visual feedback.
         """
         if hasattr(self, "color_mode_dropdown") and self.color_mode_dropdown is not None and not self.providers_only:
-            # Get the selected text and convert to internal format
-            selected_text = self.color_mode_dropdown.currentText()
-            mode_mapping = {_("Auto"): "auto", _("Light"): "light", _("Dark"): "dark"}
-            color_mode = mode_mapping.get(selected_text, "auto")
+            color_mode = self.color_mode_dropdown.currentData() or "auto"
 
             self.app.settings_manager.color_mode = color_mode
 
@@ -651,113 +762,70 @@ class SettingsWindow(ThemeAwareMixin, ThemedWidget):
             # Apply color mode change immediately via centralized theme manager
             theme_manager.change_theme(color_mode)
 
-            # Refresh UI styles with updated colorMode
-            self._refresh_ui_styles()
-
-    def _refresh_ui_styles(self):
-        """Refresh all UI element styles to reflect the current color mode."""
-        # Update color mode dropdown style
-        if hasattr(self, 'color_mode_dropdown') and self.color_mode_dropdown:
-            self.color_mode_dropdown.setStyleSheet(self.get_dropdown_style())
-
-        # Update provider dropdown style
-        if hasattr(self, 'provider_dropdown') and self.provider_dropdown:
-            self.provider_dropdown.setStyleSheet(self.get_dropdown_style())
-
-        # Update specific labels with their individual styles
-        # Title label
-        title_labels = self.findChildren(QtWidgets.QLabel)
-        for widget in title_labels:
-            if widget.text() == _("Settings"):
-                widget.setStyleSheet(f"font-size: 24px; font-weight: bold; {self.get_label_style()}")
-            elif widget.text() in [
-                _("Shortcut Key:"),
-                _("Background Theme:"),
-                _("Color Mode:"),
-                _("Choose AI Provider:"),
-            ]:
-                widget.setStyleSheet(self.get_label_style())
-
-        # Update provider-specific labels by checking all labels
-        for widget in title_labels:
-            # Check if this is a provider name (contains provider name text)
-            if (
-                hasattr(widget, 'text')
-                and widget.text()
-                and any(provider in widget.text() for provider in ["Ollama", "OpenAI", "Anthropic", "Groq"])
-            ):
-                # Provider title needs high contrast - force pure white/black
-                # Use effective mode based on user settings
-                current_mode = self._get_effective_mode()
-                provider_color = '#ffffff' if current_mode == 'dark' else '#000000'
-                widget.setStyleSheet(f"font-size: 18px; font-weight: bold; color: {provider_color};")
-            # Check if this is a description (longer text, not a simple label)
-            elif hasattr(widget, 'text') and widget.text() and len(widget.text()) > 50:
-                widget.setStyleSheet(f"{self.get_label_style()} text-align: center;")
-            # Update all other labels (field labels like "API Base URL", "API Model", etc.)
-            elif (
-                hasattr(widget, 'text')
-                and widget.text()
-                and widget.text()
-                not in [
-                    _("Settings"),
-                    _("Shortcut Key:"),
-                    _("Background Theme:"),
-                    _("Color Mode:"),
-                    _("Choose AI Provider:"),
-                ]
-                and len(widget.text()) <= 50
-                and not any(provider in widget.text() for provider in ["Ollama", "OpenAI", "Anthropic", "Groq"])
-            ):
-                # Apply standard label style for field labels
-                current_mode = self._get_effective_mode()
-                label_color = '#ffffff' if current_mode == 'dark' else '#333333'
-                widget.setStyleSheet(f"font-size: 16px; color: {label_color};")
-
-        # Update shortcut input if exists
-        if hasattr(self, 'shortcut_input') and self.shortcut_input:
-            self.shortcut_input.setStyleSheet(self.get_input_style())
-
-        # Update radio buttons if they exist
-        if hasattr(self, 'gradient_radio') and self.gradient_radio:
-            radio_style = self.get_radio_style()
-            self.gradient_radio.setStyleSheet(radio_style)
-            if hasattr(self, 'plain_radio') and self.plain_radio:
-                self.plain_radio.setStyleSheet(radio_style)
-
-        # Update checkbox if it exists
-        if hasattr(self, 'autostart_checkbox') and self.autostart_checkbox:
-            self.autostart_checkbox.setStyleSheet(self.get_checkbox_style())
-
-        # Force background update
+            # Restyle the window with updated colorMode
+            self._apply_stylesheet()
+
+    def _apply_stylesheet(self):
+        """Install the window stylesheet for the current color mode, unless it is already in use."""
+        current_mode = self._get_effective_mode()
+        if current_mode == self._stylesheet_mode:
+            return
+        self._stylesheet_mode = current_mode
+
+        stylesheet = self._stylesheet_cache.get(current_mode)
+        if stylesheet is None:
+            stylesheet = self._stylesheet_cache[current_mode] = self._build_stylesheet(current_mode)
+        # One parse and polish of the whole window instead of a stylesheet per widget
+        self.setStyleSheet(stylesheet)
+
         if hasattr(self, 'background') and self.background:
             self.background.update()
 
+    @staticmethod
+    def _build_stylesheet(current_mode):
+        """Build the stylesheet covering every themed widget of the window for the given color mode."""
+        stylesheet = _WINDOW_QSS_TEMPLATE
+        for variable, value in _PALETTES['dark' if current_mode == 'dark' else 'light'].items():
+            stylesheet = stylesheet.replace(variable, value)
+        if current_mode != 'dark':
+            stylesheet += _LIGHT_CHECKBOX_QSS
+        return stylesheet
+
     def auto_save_provider(self):
         """
         Auto-save provider selection when it changes.
+        When the selection changes several times in a row, only the last provider is saved.
         """
         if hasattr(self, "provider_dropdown") and self.provider_dropdown is not None:
             provider_internal_name = self.provider_dropdown.currentData()
             if provider_internal_name:
                 self.app.settings_manager.provider = provider_internal_name
                 # Save provider-specific settings as well
-                self.save_provider_settings()
+                self._pending_selected_provider = provider_internal_name
+                self._provider_save_timer.start()
 
-    def save_provider_settings(self):
+    def save_provider_settings(self, provider_internal_name=None):
         """
-        Save current provider-specific settings.
+        Save provider-specific settings, of the provider selected in the dropdown by default.
+        The config is written once changes pause, so a burst of changes is saved only once.
         """
-        if hasattr(self, "provider_dropdown") and self.provider_dropdown is not None:
+        if provider_internal_name is None and self.provider_dropdown is not None:
             provider_internal_name = self.provider_dropdown.currentData()
-            if provider_internal_name:
-                # Find the corresponding provider instance
-                selected_provider = next(
-                    (provider for provider in self.app.providers if provider.internal_name == provider_internal_name),
-                    None,
-                )
-                if selected_provider:
-                    selected_provider.save_config()
+        if provider_internal_name:
+            self._pending_provider_saves.add(provider_internal_name)
+            self._provider_save_timer.start()
+
+    def _save_pending_providers(self):
+        """Save the config of every provider changed since the last save."""
+        self._provider_save_timer.stop()
+        pending, self._pending_provider_saves = self._pending_provider_saves, set()
+        if self._pending_selected_provider:
+            pending.add(self._pending_selected_provider)
+            self._pending_selected_provider = None
+        for provider_internal_name in pending:
+            provider = self.app.providers_by_name.get(provider_internal_name)
+            if provider:
+                provider.save_config()
 
     def toggle_autostart(self, state):
         """Toggle the autostart setting based on checkbox state."""
@@ -801,34 +869,36 @@ class SettingsWindow(ThemeAwareMixin, ThemedWidget):
         Save all current settings to persistent storage without closing the window.
         Handles both general app settings and provider-specific configurations.
         """
+        # The hotkey is registered below with everything else
+        self._shortcut_save_timer.stop()
+
+        settings_manager = self.app.settings_manager
+        provider_internal_name = self.provider_dropdown.currentData() if self.provider_dropdown is not None else None
+
         # Save general app settings (not in providers_only mode)
         if not self.providers_only:
             if hasattr(self, "shortcut_input") and self.shortcut_input is not None:
-                self.app.settings_manager.hotkey = self.shortcut_input.text() or "ctrl+space"
+                settings_manager.hotkey = self.shortcut_input.text() or "ctrl+space"
             if hasattr(self, "gradient_radio") and self.gradient_radio is not None:
                 theme = "gradient" if self.gradient_radio.isChecked() else "plain"
-                self.app.settings_manager.theme = theme or "gradient"
+                settings_manager.theme = theme or "gradient"
             if hasattr(self, "color_mode_dropdown") and self.color_mode_dropdown is not None:
-                selected_text = self.color_mode_dropdown.currentText()
-                mode_mapping = {_("Auto"): "auto", _("Light"): "light", _("Dark"): "dark"}
-                color_mode = mode_mapping.get(selected_text, "auto")
-                self.app.settings_manager.color_mode = color_mode
+                settings_manager.color_mode = self.color_mode_dropdown.currentData() or "auto"
         else:
             # Create tray icon after initial setup completion
             self.app.create_tray_icon()
 
         # Save provider selection using internal name from dropdown data
-        if hasattr(self, "provider_dropdown") and self.provider_dropdown is not None:
-            provider_internal_name = self.provider_dropdown.currentData()
-            self.app.settings_manager.provider = provider_internal_name or "gemini"
+        if self.provider_dropdown is not None:
+            settings_manager.provider = provider_internal_name or "gemini"
 
         # Find the corresponding provider instance
-        selected_provider = next(
-            (provider for provider in self.app.providers if provider.internal_name == provider_internal_name),
-            self.app.providers[0],
-        )
+        selected_provider = self.app.providers_by_name.get(provider_internal_name, self.app.providers[0])
 
-        # Save provider-specific configuration
+        # Save provider-specific configuration, along with other providers changed since the last save
+        self._pending_provider_saves.discard(selected_provider.internal_name)
+        self._pending_selected_provider = None
+        self._save_pending_providers()
         selected_provider.save_config()
 
         # Update application's current provider
@@ -848,27 +918,30 @@ class SettingsWindow(ThemeAwareMixin, ThemedWidget):
 
     def _on_provider_changed(self):
         """
-        Handle provider dropdown change by rebuilding the provider-specific UI.
+        Handle provider dropdown change by showing the provider-specific UI.
         This ensures the settings interface matches the selected provider's requirements.
         """
         current_internal_name = self.provider_dropdown.currentData() if self.provider_dropdown else None
 
-        provider_instance = next(
-            (provider for provider in self.app.providers if provider.internal_name == current_internal_name),
-            self.app.providers[0],
-        )
-        self.init_provider_ui(provider_instance, self.provider_container)
+        provider_instance = self.app.providers_by_name.get(current_internal_name, self.app.providers[0])
+        self.show_provider_page(provider_instance)
 
     def closeEvent(self, event):
         """
         Handle window close event.
         Emits close signal for providers_only mode to notify parent about setup completion.
         """
+        # Apply a shortcut still waiting for typing to pause
+        if self._shortcut_save_timer.isActive():
+            self._save_shortcut()
+        # Same for provider settings changed just before closing
+        if self._provider_save_timer.isActive():
+            self._save_pending_providers()
+
         if self.providers_only:
             self.close_signal.emit()
         super().closeEvent(event)
 
     def refresh_theme(self):
         """Appelé automatiquement quand le thème change via ThemeManager."""
-        # Utiliser l'ancienne méthode pour l'instant, sera refactorisée plus tard
-        self._refresh_ui_styles()
+        self._apply_stylesheet()
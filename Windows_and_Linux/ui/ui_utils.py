@@ -1,5 +1,7 @@
+import functools
 import os
 import sys
+from typing import Optional
 
 import darkdetect
 from PySide6 import QtCore, QtGui, QtWidgets
@@ -48,6 +50,18 @@ def get_icon_path(icon_name, with_theme=True) -> str:
     Returns:
         Path to the icon file
     """
+    theme_suffix = None
+    if with_theme:
+        theme_suffix = "_dark" if get_effective_color_mode() == "dark" else "_light"
+    return _find_icon_path(icon_name, theme_suffix)
+
+
+@functools.lru_cache(maxsize=256)
+def _find_icon_path(icon_name, theme_suffix):
+    """
+    Look up an icon file on disk, once per (name, theme suffix): icons don't move while
+    the app runs, so repeated lookups don't probe the filesystem again.
+    """
     # Use sys.executable for frozen apps, sys.argv[0] for scripts
     if getattr(sys, "frozen", False):
         base_dir = os.path.dirname(sys.executable)
@@ -72,9 +86,7 @@ def get_icon_path(icon_name, with_theme=True) -> str:
     # Define possible extensions and filenames
     extensions = [".svg", ".png"]  # SVG takes precedence
 
-    if with_theme:
-        current_mode = get_effective_color_mode()
-        theme_suffix = "_dark" if current_mode == "dark" else "_light"
+    if theme_suffix:
         filenames = [f"{icon_name}{theme_suffix}{ext}" for ext in extensions]
         # Fallback to non-themed version if themed version doesn't exist
         filenames.extend([f"{icon_name}{ext}" for ext in extensions])
@@ -145,6 +157,15 @@ class ui_utils:
         targetPixmap = QPixmap.fromImage(target)
         return targetPixmap
 
+    @classmethod
+    @functools.lru_cache(maxsize=64)
+    def load_rounded_image(cls, image_path, image_size=100, rounding_amount=50):
+        """
+        Load an image file as a resized and rounded pixmap, decoded and composed once per
+        (path, size, rounding). Pixmaps are implicitly shared, so callers can reuse the result.
+        """
+        return cls.resize_and_round_image(QImage(image_path), image_size, rounding_amount)
+
 
 class ThemedWidget(QWidget):
     def __init__(self):
@@ -167,92 +188,58 @@ class ThemedWidget(QWidget):
         """Add minimize button to the window."""
         self.setWindowFlags(self.windowFlags() | QtCore.Qt.WindowType.WindowMinimizeButtonHint)
 
-    def get_dropdown_style(self):
-        """Get standardized dropdown styling based on current theme."""
-        current_mode = get_effective_color_mode()
-        if current_mode == 'dark':
-            return """
-                QComboBox {
-                    background-color: #444;
-                    color: #ffffff;
-                    border: 1px solid #666;
-                    padding: 5px;
-                    font-size: 16px;
-                }
-                QComboBox QAbstractItemView {
-                    background-color: #444;
-                    color: #ffffff;
-                    selection-background-color: #666;
-                }
-            """
-        else:
-            return """
-                QComboBox {
-                    background-color: white;
-                    color: #000000;
-                    border: 1px solid #ccc;
-                    padding: 5px;
-                    font-size: 16px;
-                }
-                QComboBox QAbstractItemView {
-                    background-color: white;
-                    color: #000000;
-                    selection-background-color: #e0e0e0;
-                }
-            """
-
-    def get_input_style(self):
-        """Get standardized input field styling based on current theme."""
-        current_mode = get_effective_color_mode()
-        return f"""
-            font-size: 16px;
-            padding: 5px;
-            background-color: {'#444' if current_mode == 'dark' else 'white'};
-            color: {'#ffffff' if current_mode == 'dark' else '#000000'};
-            border: 1px solid {'#666' if current_mode == 'dark' else '#ccc'};
-        """
 
-    def get_radio_style(self):
-        """Get standardized radio button styling based on current theme."""
-        current_mode = get_effective_color_mode()
-        return f"color: {'#ffffff' if current_mode == 'dark' else '#333333'}; font-size: 16px;"
-
-    def get_label_style(self):
-        """Get standardized label styling based on current theme."""
-        current_mode = get_effective_color_mode()
-        color = '#ffffff' if current_mode == 'dark' else '#333333'
-        style = f"font-size: 16px; color: {color};"
-        return style
-
-    def get_checkbox_style(self):
-        """Get standardized checkbox styling based on current theme."""
-        current_mode = get_effective_color_mode()
-        if current_mode == 'dark':
-            # En mode dark, garder le style original (juste le texte)
-            return f"color: #ffffff; font-size: 16px;"
+# Background pixmaps by file name (None when the file could not be found), so that
+# repaints don't probe the filesystem and decode the PNG again
+_background_pixmaps: dict[str, Optional[QPixmap]] = {}
+
+
+def _load_background_pixmap(bg_file):
+    """
+    Load a background image, handling both dev and build modes.
+    The result is cached, the file is only looked up and decoded once per process.
+
+    Args:
+        bg_file: File name of the background image (e.g., "background_dark.png")
+
+    Returns:
+        The loaded QPixmap, or None if the file was not found
+    """
+    if bg_file in _background_pixmaps:
+        return _background_pixmaps[bg_file]
+
+    # Determine background file paths (check multiple locations)
+    if getattr(sys, "frozen", False):
+        base_dir = os.path.dirname(sys.executable)
+    else:
+        # Handle different script execution contexts
+        if sys.argv[0] in ['-c', '']:
+            # Running with python -c or similar, use current working directory
+            base_dir = os.getcwd()
         else:
-            # En mode light, améliorer la visibilité des indicateurs
-            return """
-                QCheckBox {
-                    color: #333333;
-                    font-size: 16px;
-                    spacing: 8px;
-                }
-                QCheckBox::indicator {
-                    width: 13px;
-                    height: 13px;
-                    border-radius: 2px;
-                }
-                QCheckBox::indicator:unchecked {
-                    border: 2px solid #666666;
-                    background-color: white;
-                }
-                QCheckBox::indicator:checked {
-                    border: 2px solid #666666;
-                    background-color: #666666;
-                    image: url(data:image/svg+xml;base64,PHN2ZyB3aWR0aD0iOSIgaGVpZ2h0PSI5IiB2aWV3Qm94PSIwIDAgOSA5IiBmaWxsPSJub25lIiB4bWxucz0iaHR0cDovL3d3dy53My5vcmcvMjAwMC9zdmciPgo8cGF0aCBkPSJNNy41IDIuNUwzLjc1IDYuMjVMMi41IDUiIHN0cm9rZT0id2hpdGUiIHN0cm9rZS13aWR0aD0iMS4yIiBzdHJva2UtbGluZWNhcD0icm91bmQiIHN0cm9rZS1saW5lam9pbj0icm91bmQiLz4KPC9zdmc+Cg==);
-                }
-            """
+            base_dir = os.path.dirname(os.path.abspath(sys.argv[0]))
+
+        # If we're in the Windows_and_Linux subdirectory, go up one level
+        if os.path.basename(base_dir) == "Windows_and_Linux":
+            base_dir = os.path.dirname(base_dir)
+
+    # Try multiple locations for background files
+    possible_paths = [
+        os.path.join(base_dir, bg_file),  # Build location (dist/)
+        os.path.join(base_dir, "config", "backgrounds", bg_file),  # Dev location
+        os.path.join(base_dir, "Windows_and_Linux", "config", "backgrounds", bg_file),  # Root project location
+        os.path.join(base_dir, "Windows_and_Linux", "dist", "dev", bg_file),  # Dev build location
+        os.path.join("config", "backgrounds", bg_file),  # Relative dev location
+    ]
+
+    background_image = None
+    for path in possible_paths:
+        if os.path.exists(path):
+            background_image = QtGui.QPixmap(path)
+            break
+
+    _background_pixmaps[bg_file] = background_image
+    return background_image
 
 
 class ThemeBackground(QWidget):
@@ -266,6 +253,32 @@ class ThemeBackground(QWidget):
         self.theme = theme
         self.is_popup = is_popup
         self.border_radius = border_radius
+        # Background image scaled to the widget, with the file and device size it was made for
+        self._scaled_background = None
+        self._scaled_background_key = None
+
+    def _get_scaled_background(self, bg_file):
+        """
+        Get the background image scaled to the widget size, scaling it again only when
+        the widget is resized or the image changes (e.g. on a color mode switch).
+        """
+        background_image = _load_background_pixmap(bg_file)
+        if background_image is None:
+            return None
+
+        dpr = self.devicePixelRatioF()
+        key = (bg_file, self.width(), self.height(), dpr)
+        if key != self._scaled_background_key:
+            # Scale to device pixels so HiDPI screens keep the full image resolution
+            self._scaled_background = background_image.scaled(
+                round(self.width() * dpr),
+                round(self.height() * dpr),
+                QtCore.Qt.AspectRatioMode.IgnoreAspectRatio,
+                QtCore.Qt.TransformationMode.SmoothTransformation,
+            )
+            self._scaled_background.setDevicePixelRatio(dpr)
+            self._scaled_background_key = key
+        return self._scaled_background
 
     def paintEvent(self, event):
         """
@@ -275,41 +288,13 @@ class ThemeBackground(QWidget):
         painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing, True)
         painter.setRenderHint(QtGui.QPainter.RenderHint.SmoothPixmapTransform, True)
         if self.theme == "gradient":
-            # Determine background file paths (check multiple locations)
-            if getattr(sys, "frozen", False):
-                base_dir = os.path.dirname(sys.executable)
-            else:
-                # Handle different script execution contexts
-                if sys.argv[0] in ['-c', '']:
-                    # Running with python -c or similar, use current working directory
-                    base_dir = os.getcwd()
-                else:
-                    base_dir = os.path.dirname(os.path.abspath(sys.argv[0]))
-
-                # If we're in the Windows_and_Linux subdirectory, go up one level
-                if os.path.basename(base_dir) == "Windows_and_Linux":
-                    base_dir = os.path.dirname(base_dir)
-
             current_mode = get_effective_color_mode()
             if self.is_popup:
                 bg_file = "background_popup_dark.png" if current_mode == "dark" else "background_popup.png"
             else:
                 bg_file = "background_dark.png" if current_mode == "dark" else "background.png"
 
-            # Try multiple locations for background files
-            possible_paths = [
-                os.path.join(base_dir, bg_file),  # Build location (dist/)
-                os.path.join(base_dir, "config", "backgrounds", bg_file),  # Dev location
-                os.path.join(base_dir, "Windows_and_Linux", "config", "backgrounds", bg_file),  # Root project location
-                os.path.join(base_dir, "Windows_and_Linux", "dist", "dev", bg_file),  # Dev build location
-                os.path.join("config", "backgrounds", bg_file),  # Relative dev location
-            ]
-
-            background_image = None
-            for path in possible_paths:
-                if os.path.exists(path):
-                    background_image = QtGui.QPixmap(path)
-                    break
+            background_image = self._get_scaled_background(bg_file)
 
             if background_image is None:
                 # Fallback to a solid color if no background found